@@ -8,7 +8,20 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import time
 import os
+import atexit
 from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Falhas transitórias de gateway repetidas pelos dois clientes HTTP (requests e httpx)
+GATEWAY_RETRY_STATUSES = (502, 504)
+GATEWAY_RETRIES = 2
 
 class Settings(BaseSettings):
     network: str = "testnet"
@@ -149,13 +162,94 @@ def get_mempool_api_url(network: str = None):
     if not network:
         network = get_network()
     
-    base_url = get_settings().mempool_api_url
-    
+    base_url = get_settings().mempool_api_url.rstrip("/")
+
     if network == "testnet":
+        # O mempool.space expõe a testnet antes do sufixo /api (https://mempool.space/testnet/api)
+        if base_url.endswith("/api"):
+            return f"{base_url[:-len('/api')]}/testnet/api"
         return f"{base_url}/testnet"
-    
+
     return base_url
 
+@lru_cache
+def get_http_session() -> requests.Session:
+    """
+    Retorna uma sessão HTTP compartilhada para as consultas às APIs de blockchain.
+    
+    A sessão mantém as conexões abertas (keep-alive) em um pool por host, evitando
+    um novo handshake TCP/TLS a cada consulta, e repete automaticamente falhas
+    transitórias de gateway (502/504).
+    
+    Returns:
+        requests.Session: Sessão configurada, fechada automaticamente ao encerrar o processo
+    """
+    session = requests.Session()
+    # 429/503 não são repetidos aqui: quem chama registra o Retry-After e usa outra API.
+    # Sem backoff entre tentativas: a falha de gateway é repetida imediatamente e a
+    # thread não fica bloqueada dormindo enquanto outra API poderia responder.
+    # Falhas de conexão e timeouts não são repetidos: o timeout de quem chama vale
+    # para a consulta inteira e a exceção original (ex.: ReadTimeout) é preservada
+    retry = Retry(total=GATEWAY_RETRIES, connect=False, read=False, other=0, backoff_factor=0,
+                  status_forcelist=list(GATEWAY_RETRY_STATUSES), allowed_methods=["GET"])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept": "application/json",
+        "User-Agent": "btc-wallet/1.0"
+    })
+    atexit.register(session.close)
+    return session
+
+if httpx is not None:
+    class _GatewayRetryTransport(httpx.HTTPTransport):
+        """
+        Transporte httpx que repete GETs respondidos com 502/504, como o Retry da
+        sessão requests: sem backoff e sem repetir falhas de conexão ou timeouts.
+        """
+        def handle_request(self, request):
+            response = super().handle_request(request)
+            retries = GATEWAY_RETRIES if request.method == "GET" else 0
+            while retries and response.status_code in GATEWAY_RETRY_STATUSES:
+                response.close()
+                retries -= 1
+                response = super().handle_request(request)
+            return response
+
+@lru_cache
+def get_http2_client():
+    """
+    Retorna um cliente HTTP/2 compartilhado, se httpx com suporte a HTTP/2 estiver instalado.
+    
+    Com HTTP/2 várias consultas simultâneas ao mesmo host são multiplexadas em uma
+    única conexão TLS, em vez de ocupar uma conexão do pool cada. Falhas de gateway
+    (502/504) são repetidas da mesma forma que na sessão de get_http_session().
+    
+    Returns:
+        httpx.Client ou None: Cliente configurado, ou None se httpx/h2 não estiverem disponíveis
+    """
+    if httpx is None:
+        logging.getLogger("bitcoin-wallet").info("httpx[http2] não instalado, usando requests")
+        return None
+    try:
+        client = httpx.Client(
+            transport=_GatewayRetryTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=8)
+            ),
+            timeout=15.0,
+            headers={
+                "Accept": "application/json",
+                "User-Agent": "btc-wallet/1.0"
+            }
+        )
+    except ImportError:
+        logging.getLogger("bitcoin-wallet").info("httpx[http2] não instalado, usando requests")
+        return None
+    atexit.register(client.close)
+    return client
+
 def setup_logging():
     """Configura o logging da aplicação com base nas configurações do .env"""
     settings = get_settings()
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Annotated, List, Optional
 
 class TransactionStatusModel(BaseModel):
     txid: str = Field(..., description="ID da transação (hash da transação)")
@@ -25,3 +25,22 @@ class TransactionStatusModel(BaseModel):
             ]
         }
     }
+
+# Mesmo formato exigido pela rota de status individual: hash de 64 caracteres hexadecimais
+TxId = Annotated[str, Field(pattern=r"^[0-9a-fA-F]{64}$")]
+
+class TransactionStatusBatchRequest(BaseModel):
+    txids: List[TxId] = Field(..., min_length=1, max_length=100, description="IDs das transações a consultar")
+    
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "txids": [
+                        "7a1ae0dc85ea676e63485de4394a5d78fbfc8c02e012c0ebb19ce91f573d283e",
+                        "f4184fc596403b9d638783cf57adfe4c75c605f6356fbc91338530e9831e9e16"
+                    ]
+                }
+            ]
+        }
+    }
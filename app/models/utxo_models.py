@@ -1,5 +1,5 @@
-from pydantic import BaseModel, field_serializer
-from typing import List, Optional, Dict, Any, Union
+from pydantic import BaseModel
+from typing import List, Optional, Dict, Any
 
 class Input(BaseModel):
     txid: str
@@ -22,16 +22,6 @@ class Input(BaseModel):
             ]
         }
     }
-    
-    @field_serializer('vout')
-    def serialize_vout(self, vout: int) -> Union[int, str]:
-        return vout
-    
-    @field_serializer('value')
-    def serialize_value(self, value: Optional[int]) -> Optional[Union[int, str]]:
-        if value is None:
-            return None
-        return value
 
 class Output(BaseModel):
     address: str
@@ -47,10 +37,6 @@ class Output(BaseModel):
             ]
         }
     }
-    
-    @field_serializer('value')
-    def serialize_value(self, value: int) -> Union[int, str]:
-        return value
 
 class TransactionRequest(BaseModel):
     inputs: List[Input]  
@@ -16,6 +16,23 @@ class ValidateRequest(BaseModel):
         }
     }
 
+class ValidateBatchRequest(BaseModel):
+    tx_hexes: List[str] = Field(..., min_length=1, max_length=100, description="Transações Bitcoin em formato hexadecimal (até 100)")
+    network: Optional[str] = Field(None, description="Rede Bitcoin (mainnet ou testnet)")
+    
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "tx_hexes": [
+                        "0200000001fd885a6a456f5a11d1c417cd8c6a8ba9d355d1e16d7c137a60fece8e8c13793"
+                    ],
+                    "network": "testnet"
+                }
+            ]
+        }
+    }
+
 class ValidateResponse(BaseModel):
     is_valid: bool = Field(..., description="Indica se a transação é válida")
     details: Dict = Field(..., description="Detalhes da transação validada")
@@ -5,12 +5,23 @@ from app.models.balance_models import BalanceModel
 import logging
 from bitcoinlib.keys import Address
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 import re
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Formatos aceitos por rede (Legacy, SegWit P2SH e Native SegWit) em uma única
+# expressão compilada, em vez de até três re.match com o padrão em texto por chamada
+_ADDRESS_PATTERNS = {
+    "testnet": re.compile(r'^(?:[mn2][a-km-zA-HJ-NP-Z1-9]{25,34}|tb1[a-zA-HJ-NP-Z0-9]{39,59})$'),
+    "mainnet": re.compile(r'^(?:[13][a-km-zA-HJ-NP-Z1-9]{25,34}|bc1[a-zA-HJ-NP-Z0-9]{39,59})$'),
+}
+
+# Consulta o saldo em paralelo com os UTXOs; compartilhado entre requisições
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="balance")
+
 def validate_bitcoin_address(address: str, network: str) -> bool:
     """
     Valida se um endereço Bitcoin é válido para a rede especificada.
@@ -23,24 +34,9 @@ def validate_bitcoin_address(address: str, network: str) -> bool:
         bool: True se o endereço for válido, False caso contrário
     """
     try:
-        if network == "testnet":
-            if re.match(r'^[mn][a-km-zA-HJ-NP-Z1-9]{25,34}$', address):
-                return True
-            # SegWit (P2SH)
-            if re.match(r'^2[a-km-zA-HJ-NP-Z1-9]{25,34}$', address):
-                return True
-            # Native SegWit (P2WPKH)
-            if re.match(r'^tb1[a-zA-HJ-NP-Z0-9]{39,59}$', address):
-                return True
-        else:  # mainnet
-            if re.match(r'^1[a-km-zA-HJ-NP-Z1-9]{25,34}$', address):
-                return True
-            # SegWit (P2SH)
-            if re.match(r'^3[a-km-zA-HJ-NP-Z1-9]{25,34}$', address):
-                return True
-            # Native SegWit (P2WPKH)
-            if re.match(r'^bc1[a-zA-HJ-NP-Z0-9]{39,59}$', address):
-                return True
+        pattern = _ADDRESS_PATTERNS["testnet" if network == "testnet" else "mainnet"]
+        if pattern.match(address):
+            return True
         
         try:
             addr = Address.import_address(address)
@@ -162,8 +158,11 @@ def get_balance_utxos(
                     detail=f"Endereço Bitcoin inválido para a rede {network}"
                 )
         
-        balance_data = get_balance(address, network, offline_mode)
+        # As duas consultas são independentes: o saldo roda no pool enquanto
+        # os UTXOs são buscados na thread da requisição
+        balance_future = _executor.submit(get_balance, address, network, offline_mode)
         utxos_data = get_utxos(address, network, offline_mode)
+        balance_data = balance_future.result()
         
         if not offline_mode and balance_data["confirmed"] == 0 and balance_data["unconfirmed"] == 0 and not utxos_data:
             raise HTTPException(
@@ -171,10 +170,12 @@ def get_balance_utxos(
                 detail="Endereço não encontrado ou sem transações"
             )
         
-        return BalanceModel(
-            balance=balance_data['confirmed'],
-            utxos=utxos_data
-        )
+        # Dicionário simples: o FastAPI já valida a resposta contra response_model,
+        # então montar BalanceModel aqui validaria cada UTXO duas vezes
+        return {
+            "balance": balance_data['confirmed'],
+            "utxos": utxos_data
+        }
         
     except HTTPException:
         raise
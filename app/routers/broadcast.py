@@ -1,7 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from app.models.broadcast_models import BroadcastRequest, BroadcastResponse
-import requests
-from app.dependencies import get_blockchain_api_url
+from app.dependencies import get_blockchain_api_url, get_http_session
 import logging
 
 logger = logging.getLogger(__name__)
@@ -70,7 +69,7 @@ def broadcast_transaction(request: BroadcastRequest):
     """
     try:
         url = f"{get_blockchain_api_url()}/tx"
-        response = requests.post(url, json={"tx": request.tx_hex})
+        response = get_http_session().post(url, json={"tx": request.tx_hex})
         
         if response.status_code != 200:
             logger.error(f"Erro ao transmitir transação: {response.text}")
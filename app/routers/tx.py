@@ -1,8 +1,9 @@
 # app/routers/tx.py
 from fastapi import APIRouter, HTTPException, Path, Query, Body
-from app.models.transaction_status_models import TransactionStatusModel
+from typing import List
+from app.models.transaction_status_models import TransactionStatusModel, TransactionStatusBatchRequest
 from app.models.utxo_models import TransactionRequest, TransactionResponse
-from app.services.tx_status_service import get_transaction_status
+from app.services.tx_status_service import get_transaction_status, get_transaction_statuses
 from app.services.transaction.tx_builder_service import build_transaction
 from app.dependencies import get_network
 import logging
@@ -89,6 +90,44 @@ def get_tx_status(
         logger.error(f"Erro ao consultar status da transação: {str(e)}", exc_info=True)
         raise HTTPException(status_code=404, detail=f"Erro ao consultar transação: {str(e)}")
 
+@router.post("/status/batch",
+            summary="Consulta o status de várias transações Bitcoin",
+            description="""
+Consulta o status de até 100 transações em uma única requisição.
+
+As transações já presentes no cache são respondidas imediatamente e as demais
+são consultadas em paralelo. A resposta mantém a ordem dos txids enviados.
+
+## Exemplo de requisição:
+```json
+{
+  "txids": [
+    "7a1ae0dc85ea676e63485de4394a5d78fbfc8c02e012c0ebb19ce91f573d283e",
+    "f4184fc596403b9d638783cf57adfe4c75c605f6356fbc91338530e9831e9e16"
+  ]
+}
+```
+            """,
+            response_model=List[TransactionStatusModel])
+def get_tx_statuses(
+    batch_request: TransactionStatusBatchRequest = Body(..., description="Lista de txids a consultar"),
+    network: str = Query(None, description="Rede Bitcoin (mainnet ou testnet)")
+):
+    """
+    Consulta o status de várias transações Bitcoin.
+    
+    - **batch_request**: Lista de IDs de transação
+    - **network**: Rede Bitcoin (mainnet ou testnet)
+    
+    Retorna o status de cada transação, na mesma ordem da requisição.
+    """
+    try:
+        network = network or get_network()
+        return get_transaction_statuses(batch_request.txids, network)
+    except Exception as e:
+        logger.error(f"Erro ao consultar status das transações: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Erro ao consultar transações: {str(e)}")
+
 @router.post("/build", 
             summary="Constrói uma transação Bitcoin não assinada",
             description="""
@@ -173,6 +212,11 @@ def build_tx(
         
         result = build_transaction(tx_request, network)
         return result
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.warning(f"[TX_BUILD] Requisição inválida: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"[TX_BUILD] Erro ao construir transação: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Erro ao construir transação: {str(e)}")
\ No newline at end of file
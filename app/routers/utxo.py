@@ -120,6 +120,8 @@ def build_transaction(request: TransactionRequest):
         )
         
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erro ao construir transação: {str(e)}", exc_info=True)
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
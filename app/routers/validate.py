@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException
-from app.models.validate_models import ValidateRequest, ValidateResponse
-from app.services.validate_service import validate_transaction
+from typing import List
+from app.models.validate_models import ValidateRequest, ValidateBatchRequest, ValidateResponse
+from app.services.validate_service import validate_transaction, validate_transactions
 from app.dependencies import get_network
 import logging
 
@@ -105,4 +106,40 @@ def validate_tx(request: ValidateRequest):
         return result
     except Exception as e:
         logger.error(f"Erro na rota de validação: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/batch",
+            summary="Valida várias transações Bitcoin",
+            description="""
+Valida até 100 transações em uma única requisição.
+
+Os UTXOs de todos os endereços do lote são consultados uma única vez e as
+transações são validadas em paralelo. Cada item da resposta tem o mesmo formato
+da validação individual e a ordem das transações enviadas é mantida.
+
+## Exemplo de requisição:
+```json
+{
+  "tx_hexes": [
+    "0200000001fd885a6a456f5a11d1c417cd8c6a8ba9d355d1e16d7c137a60fece8e8c13793"
+  ],
+  "network": "testnet"
+}
+```
+            """,
+            response_model=List[ValidateResponse])
+def validate_tx_batch(request: ValidateBatchRequest):
+    """
+    Valida várias transações Bitcoin.
+    
+    - **tx_hexes**: Transações em formato hexadecimal
+    - **network**: Rede Bitcoin (testnet ou mainnet)
+    
+    Retorna o resultado de cada validação, na mesma ordem da requisição.
+    """
+    try:
+        network = request.network or get_network()
+        return validate_transactions(request.tx_hexes, network)
+    except Exception as e:
+        logger.error(f"Erro na rota de validação em lote: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,5 +1,5 @@
 import requests
-from app.dependencies import get_blockchain_api_url, get_cache_dir, get_cache_timeout, is_offline_mode_enabled
+from app.dependencies import get_blockchain_api_url, get_cache_dir, get_cache_timeout, get_http_session, is_offline_mode_enabled
 from fastapi import HTTPException
 import logging
 from functools import lru_cache
@@ -7,29 +7,57 @@ from typing import Dict, List, Any, Optional
 import time
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serializa em bytes, como orjson.dumps"""
+        return json.dumps(obj).encode()
+
 logger = logging.getLogger(__name__)
 
+MAX_BATCH_WORKERS = 16
+REQUEST_TIMEOUT = 10
+# Na testnet as consultas de endereço usam a API Esplora da blockstream.info
+TESTNET_API_URL = "https://blockstream.info/testnet/api"
+
 class PersistentBlockchainCache:
     def __init__(self):
         self._cache = {}
         self._timestamps = {}
+        # Serializa escritas: o cache é compartilhado entre as threads das consultas em paralelo
+        self._lock = threading.RLock()
+        # Configurações fixas durante a vida do processo, resolvidas uma única vez
+        # em vez de a cada leitura/escrita
+        self._cache_file = get_cache_dir() / "blockchain_cache.json"
+        self._cache_timeout = get_cache_timeout(cold_wallet=is_offline_mode_enabled())
+        # Blocos batch() ativos (em todas as threads), aninhamento por thread e
+        # escritas pendentes de gravação em disco
+        self._batch_depth = 0
+        self._thread_batches = threading.local()
+        self._dirty = False
         self._ensure_cache_dir()
         self._load_cache()
     
     def _ensure_cache_dir(self):
         """Garante que o diretório de cache existe"""
-        cache_dir = get_cache_dir()
-        os.makedirs(cache_dir, exist_ok=True)
+        os.makedirs(self._cache_file.parent, exist_ok=True)
     
     def _load_cache(self):
         """Carrega o cache do disco"""
-        cache_file = get_cache_dir() / "blockchain_cache.json"
-        if cache_file.exists():
+        if self._cache_file.exists():
             try:
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
+                with open(self._cache_file, "rb") as f:
+                    data = _json_loads(f.read())
                     self._cache = data.get("cache", {})
                     self._timestamps = data.get("timestamps", {})
                     logger.info(f"[CACHE] Cache carregado do disco com {len(self._cache)} entradas")
@@ -38,13 +66,12 @@ class PersistentBlockchainCache:
     
     def _save_cache(self):
         """Salva o cache para o disco"""
-        cache_file = get_cache_dir() / "blockchain_cache.json"
         try:
-            with open(cache_file, "w") as f:
-                json.dump({
+            with open(self._cache_file, "wb") as f:
+                f.write(_json_dumps({
                     "cache": self._cache,
                     "timestamps": self._timestamps
-                }, f)
+                }))
                 logger.debug(f"[CACHE] Cache salvo no disco com {len(self._cache)} entradas")
         except Exception as e:
             logger.error(f"[CACHE] Erro ao salvar cache no disco: {str(e)}")
@@ -61,9 +88,7 @@ class PersistentBlockchainCache:
             O valor armazenado ou None se não encontrado ou expirado
         """
         if key in self._cache:
-            cache_timeout = get_cache_timeout(cold_wallet=is_offline_mode_enabled())
-            
-            if ignore_ttl or time.time() - self._timestamps.get(key, 0) < cache_timeout:
+            if ignore_ttl or time.time() - self._timestamps.get(key, 0) < self._cache_timeout:
                 return self._cache[key]
             elif not ignore_ttl:
                 logger.debug(f"[CACHE] Valor expirado para a chave: {key}")
@@ -77,12 +102,55 @@ class PersistentBlockchainCache:
             key: Chave para armazenar o valor
             value: Valor a ser armazenado
         """
-        self._cache[key] = value
-        self._timestamps[key] = time.time()
-        self._save_cache()
+        with self._lock:
+            # Valor igual ao já armazenado (ex.: UTXOs sem mudança): só renova o TTL
+            # em memória, sem reescrever o arquivo; o novo horário vai para o disco
+            # na próxima gravação
+            unchanged = key in self._cache and self._cache[key] == value
+            self._cache[key] = value
+            self._timestamps[key] = time.time()
+            if unchanged:
+                return
+            if self._batch_depth:
+                self._dirty = True
+            else:
+                self._save_cache()
+
+    @contextmanager
+    def batch(self):
+        """
+        Agrupa as escritas feitas dentro do bloco em uma única gravação em disco.
+        
+        Cada set() reescreve o arquivo inteiro; quando várias consultas terminam
+        juntas (lotes de UTXOs ou de status), os valores ficam disponíveis em memória
+        imediatamente e o arquivo é salvo uma vez ao sair do bloco mais externo.
+        Escritas de outras threads feitas enquanto o bloco está ativo (como as das
+        consultas em paralelo do lote) também são adiadas, mas a saída do bloco mais
+        externo de cada thread grava as pendências, mesmo que blocos de outras
+        requisições continuem abertos: com lotes sobrepostos o arquivo não fica sem
+        ser salvo indefinidamente.
+        """
+        thread_batches = self._thread_batches
+        thread_batches.depth = getattr(thread_batches, "depth", 0) + 1
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            thread_batches.depth -= 1
+            with self._lock:
+                self._batch_depth -= 1
+                if thread_batches.depth == 0 and self._dirty:
+                    self._dirty = False
+                    self._save_cache()
 
 blockchain_cache = PersistentBlockchainCache()
 
+@lru_cache(maxsize=8)
+def _api_base_url(network: str) -> str:
+    """URL base da API configurada para a rede, montada uma única vez"""
+    return get_blockchain_api_url(network)
+
 def get_balance(address: str, network: str, offline_mode: bool = False) -> dict:
     """
     Consulta o saldo de um endereço Bitcoin na blockchain.
@@ -146,8 +214,8 @@ def get_balance(address: str, network: str, offline_mode: bool = False) -> dict:
         logger.info(f"[BLOCKCHAIN] Consultando saldo para o endereço {address} na rede {network}")
         
         if network == "testnet":
-            url = f"https://blockstream.info/testnet/api/address/{address}"
-            response = requests.get(url)
+            url = f"{TESTNET_API_URL}/address/{address}"
+            response = get_http_session().get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
@@ -156,8 +224,8 @@ def get_balance(address: str, network: str, offline_mode: bool = False) -> dict:
                 "unconfirmed": data.get("mempool_stats", {}).get("funded_txo_sum", 0) - data.get("mempool_stats", {}).get("spent_txo_sum", 0)
             }
         else:
-            url = f"{get_blockchain_api_url(network)}/address/{address}/balance"
-            response = requests.get(url)
+            url = f"{_api_base_url(network)}/address/{address}/balance"
+            response = get_http_session().get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             result = response.json()
 
@@ -231,14 +299,14 @@ def get_utxos(address: str, network: str, offline_mode: bool = False) -> list:
     
     # Verificar cache primeiro
     cached_data = blockchain_cache.get(cache_key)
-    if cached_data:
+    if cached_data is not None:
         logger.info(f"[BLOCKCHAIN] Retornando UTXOs do cache para {address}")
         return cached_data
     
     # Se modo offline, verificar cache ignorando TTL
     if offline_mode:
         expired_data = blockchain_cache.get(cache_key, ignore_ttl=True)
-        if expired_data:
+        if expired_data is not None:
             logger.info(f"[OFFLINE] Usando UTXOs do cache expirado para {address}")
             return expired_data
         else:
@@ -251,8 +319,8 @@ def get_utxos(address: str, network: str, offline_mode: bool = False) -> list:
         
         if network == "testnet":
             # Para testnet, usamos uma API específica (blockstream.info)
-            url = f"https://blockstream.info/testnet/api/address/{address}/utxo"
-            response = requests.get(url)
+            url = f"{TESTNET_API_URL}/address/{address}/utxo"
+            response = get_http_session().get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             utxos = response.json()
             
@@ -272,8 +340,8 @@ def get_utxos(address: str, network: str, offline_mode: bool = False) -> list:
             blockchain_cache.set(cache_key, result)
             return result
         else:
-            url = f"{get_blockchain_api_url(network)}/address/{address}/utxo"
-            response = requests.get(url)
+            url = f"{_api_base_url(network)}/address/{address}/utxo"
+            response = get_http_session().get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             result = response.json()
             blockchain_cache.set(cache_key, result)
@@ -292,6 +360,42 @@ def get_utxos(address: str, network: str, offline_mode: bool = False) -> list:
         logger.warning(f"[BLOCKCHAIN] Retornando dados simulados: {dummy_data}")
         return dummy_data
 
+def get_utxos_batch(addresses: List[str], network: str, offline_mode: bool = False) -> Dict[str, list]:
+    """
+    Recupera os UTXOs de vários endereços em uma única chamada.
+    
+    As APIs Esplora usadas pelo serviço não têm endpoint multi-endereço, então os
+    endereços já presentes no cache são resolvidos primeiro e apenas os restantes
+    são consultados, em paralelo, via get_utxos.
+    
+    Args:
+        addresses (List[str]): Endereços Bitcoin a serem consultados
+        network (str): Rede Bitcoin ('mainnet' ou 'testnet')
+        offline_mode (bool): Se True, usa apenas dados do cache sem consultar a API
+    
+    Returns:
+        Dict[str, list]: UTXOs de cada endereço, no mesmo formato de get_utxos
+    """
+    unique_addresses = list(dict.fromkeys(addresses))
+    result = {}
+    misses = []
+    for address in unique_addresses:
+        cached_data = blockchain_cache.get(f"utxos_{network}_{address}")
+        if cached_data is not None:
+            result[address] = cached_data
+        else:
+            misses.append(address)
+    
+    if len(misses) == 1:
+        result[misses[0]] = get_utxos(misses[0], network, offline_mode)
+    elif misses:
+        logger.info(f"[BLOCKCHAIN] Consultando UTXOs de {len(misses)} endereços na rede {network}")
+        with blockchain_cache.batch(), ThreadPoolExecutor(max_workers=min(MAX_BATCH_WORKERS, len(misses))) as executor:
+            fetched = executor.map(lambda address: get_utxos(address, network, offline_mode), misses)
+            result.update(zip(misses, fetched))
+    
+    return {address: result[address] for address in unique_addresses}
+
 def is_offline_mode() -> bool:
     """
     Verifica se o modo offline está ativo.
@@ -308,8 +412,10 @@ def is_offline_mode() -> bool:
         
     # Verificar conectividade
     try:
-        # Tentativa de conexão com timeout reduzido
-        requests.get("https://blockstream.info/api/blocks/tip/height", timeout=2)
+        # Tentativa de conexão com timeout reduzido. HEAD não é repetido pelo Retry da
+        # sessão (só GETs com 502/504 são), então o teste custa no máximo uma tentativa;
+        # qualquer resposta HTTP indica conectividade
+        get_http_session().head("https://blockstream.info/api/blocks/tip/height", timeout=2)
         return False
     except:
         logger.warning("[BLOCKCHAIN] Modo offline detectado por falha na conexão")
@@ -1,9 +1,11 @@
-import requests
 import logging
 import time
 import random
+import threading
 from typing import Dict, Any
+from cachetools import TTLCache
 from app.models.fee_models import FeeEstimateModel
+from app.dependencies import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -11,13 +13,10 @@ class FeeEstimator:
     """Serviço para estimativa de taxas de transação Bitcoin"""
     
     def __init__(self):
-        self.fee_cache = {}
-        self.cache_time = 0
         self.cache_duration = 300  # 5 minutos
-    
-    def _is_cache_valid(self) -> bool:
-        """Verifica se o cache de taxas ainda é válido"""
-        return (time.time() - self.cache_time) < self.cache_duration and self.fee_cache
+        # Uma entrada por rede, expirada automaticamente após cache_duration
+        self.fee_cache = TTLCache(maxsize=8, ttl=self.cache_duration)
+        self._cache_lock = threading.Lock()
     
     def estimate_from_mempool(self, network: str = "testnet") -> Dict[str, Any]:
         """
@@ -30,9 +29,11 @@ class FeeEstimator:
             Dicionário com estimativas de taxas para diferentes prioridades
         """
         try:
-            if self._is_cache_valid():
+            with self._cache_lock:
+                cached = self.fee_cache.get(network)
+            if cached is not None:
                 logger.debug("Usando cache de taxas")
-                return self.fee_cache
+                return cached
             
             if network == "mainnet":
                 url = "https://mempool.space/api/v1/fees/recommended"
@@ -40,7 +41,7 @@ class FeeEstimator:
                 url = "https://mempool.space/testnet/api/v1/fees/recommended"
             
             logger.info(f"Consultando taxas da mempool para rede {network}")
-            response = requests.get(url, timeout=10)
+            response = get_http_session().get(url, timeout=10)
             response.raise_for_status()
             
             fee_data = response.json()
@@ -54,8 +55,8 @@ class FeeEstimator:
                 "unit": "sat/vB"
             }
             
-            self.fee_cache = result
-            self.cache_time = time.time()
+            with self._cache_lock:
+                self.fee_cache[network] = result
             
             return result
         except Exception as e:
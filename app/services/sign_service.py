@@ -40,30 +40,34 @@ def sign_transaction(tx_hex: str, private_key: str, network: str = "testnet") ->
         logger.info(f"Iniciando processo de assinatura de transação na rede {network}")
         
         key = Key(private_key, network=network)
-        logger.debug(f"Chave criada para assinatura: {key.address()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Chave criada para assinatura: {key.address()}")
         
         tx = Transaction.parse_hex(tx_hex)
         logger.debug(f"Transação carregada, inputs: {len(tx.inputs)}, outputs: {len(tx.outputs)}")
         
         original_tx_hex = tx.raw_hex()
         
-        tx.sign(key.private_byte)
+        # Passa o objeto Key já construído: com bytes a bitcoinlib recriaria
+        # a chave (e refaria a derivação da chave pública) para cada input
+        tx.sign(key)
         logger.debug("Transação assinada com sucesso")
         
-        is_signed = original_tx_hex != tx.raw_hex()
+        signed_tx_hex = tx.raw_hex()
+        is_signed = original_tx_hex != signed_tx_hex
         signatures_count = len(tx.inputs)  
         
         return {
-            "tx_hex": tx.raw_hex(),
+            "tx_hex": signed_tx_hex,
             "txid": tx.txid,
             "is_signed": is_signed,
             "signatures_count": signatures_count,
             "hash": tx.hash,
             "size": tx.size,
-            "vsize": tx.vsize if hasattr(tx, 'vsize') else tx.size,
+            "vsize": getattr(tx, 'vsize', None) or tx.size,
             "input_count": len(tx.inputs),
             "output_count": len(tx.outputs),
-            "fee": tx.fee if hasattr(tx, 'fee') else 0
+            "fee": getattr(tx, 'fee', 0)
         }
     except Exception as e:
         logger.error(f"Erro ao assinar transação: {str(e)}", exc_info=True)
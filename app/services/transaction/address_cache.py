@@ -0,0 +1,47 @@
+from functools import lru_cache
+from bitcoinlib.keys import Address, deserialize_address
+from bitcoinlib.transactions import Output
+import logging
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=16384)
+def parse_address(address: str, network: str) -> Address:
+    """
+    Decodifica um endereço Bitcoin uma única vez por par (endereço, rede).
+
+    A decodificação (Base58Check/Bech32 + verificação de checksum) é custosa e os
+    mesmos endereços (troco, depósitos recorrentes) aparecem em muitas transações.
+    A rede faz parte da chave do cache para que o mesmo texto nunca seja
+    reaproveitado entre mainnet e testnet.
+
+    Args:
+        address (str): Endereço Bitcoin
+        network (str): Rede no formato aceito pela bitcoinlib
+
+    Returns:
+        Address: Endereço decodificado, compartilhado entre chamadas e que não deve ser modificado
+        
+    Raises:
+        ValueError: Se o endereço pertencer a outra rede (ex.: endereço tb1 em uma transação mainnet)
+    """
+    logger.debug(f"[ADDR_CACHE] Decodificando endereço {address} na rede {network}")
+    # Address.parse aceita a rede informada sem conferir o prefixo do endereço; a mesma
+    # verificação que o Output da bitcoinlib faz com endereços em texto é feita aqui
+    if network not in deserialize_address(address)["networks"]:
+        raise ValueError(f"Endereço {address} não pertence à rede {network}")
+    return Address.parse(address, network=network)
+
+@lru_cache(maxsize=16384)
+def script_pubkey(address: str, network: str) -> bytes:
+    """
+    Retorna o script de bloqueio (scriptPubKey) de um endereço, calculado uma única vez.
+
+    Args:
+        address (str): Endereço Bitcoin
+        network (str): Rede no formato aceito pela bitcoinlib
+
+    Returns:
+        bytes: scriptPubKey serializado
+    """
+    return Output(0, address=parse_address(address, network), network=network).lock_script
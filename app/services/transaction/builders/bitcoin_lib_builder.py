@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
 from bitcoinlib.transactions import Transaction, Input, Output
 from app.models.utxo_models import TransactionRequest, TransactionResponse
+from app.services.transaction.address_cache import parse_address, script_pubkey
+from app.services.transaction.builders.raw_serializer import serialize_segwit_tx
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+_TXID_PATTERN = re.compile(r"[0-9a-fA-F]{64}")
+_MAX_U32 = 0xffffffff
+
 class TransactionBuilder(ABC):
     @abstractmethod
     def build(self, request: TransactionRequest, network: str) -> TransactionResponse:
@@ -13,57 +19,116 @@ class TransactionBuilder(ABC):
 class BitcoinLibBuilder(TransactionBuilder):
     def build(self, request: TransactionRequest, network: str) -> TransactionResponse:
         logger.info(f"Iniciando construção de transação para rede {network}")
-        try:
-            tx_inputs = []
-            for input_tx in request.inputs:
-                tx_input = Input(
-                    prev_txid=input_tx.txid,
-                    output_n=input_tx.vout,
-                    value=input_tx.value or 0,  
-                    address=input_tx.address,
-                    network=network
-                )
-                if input_tx.script:
-                    tx_input.script = input_tx.script
-                if input_tx.sequence:
-                    tx_input.sequence = input_tx.sequence
-                tx_inputs.append(tx_input)
-            
-            tx_outputs = []
-            for output in request.outputs:
-                tx_output = Output(
-                    value=output.value,
-                    address=output.address,
-                    network=network
-                )
-                tx_outputs.append(tx_output)
-            
-            fee = request.fee_rate or 1.0
-            tx = Transaction(
-                inputs=tx_inputs,
-                outputs=tx_outputs,
-                network=network,
-                fee=fee,
-                fee_per_kb=int(fee * 1000)  
+
+        if not request.inputs:
+            raise ValueError("Transação sem inputs")
+        if not request.outputs:
+            raise ValueError("Transação sem outputs")
+        for i, input_tx in enumerate(request.inputs):
+            if not input_tx.txid or input_tx.vout is None:
+                raise ValueError(f"Input {i} sem txid/vout")
+            # Campos serializados como hash de 32 bytes e inteiros de 4 bytes
+            if not _TXID_PATTERN.fullmatch(input_tx.txid):
+                raise ValueError(f"Input {i} com txid inválido: {input_tx.txid}")
+            if not 0 <= input_tx.vout <= _MAX_U32:
+                raise ValueError(f"Input {i} com vout fora do intervalo: {input_tx.vout}")
+            if input_tx.sequence is not None and not 0 <= input_tx.sequence <= _MAX_U32:
+                raise ValueError(f"Input {i} com sequence fora do intervalo: {input_tx.sequence}")
+        
+        # Sem scripts nos inputs a transação não assinada tem formato fixo e
+        # pode ser serializada diretamente, sem montar os objetos da bitcoinlib
+        if not any(input_tx.script for input_tx in request.inputs):
+            return self._build_raw(request, network)
+        
+        tx_inputs = []
+        input_total = 0
+        for input_tx in request.inputs:
+            tx_input = Input(
+                prev_txid=input_tx.txid,
+                output_n=input_tx.vout,
+                value=input_tx.value or 0,  
+                address=input_tx.address,
+                network=network
             )
-            
-            calculated_fee = 0
-            if tx.input_total and tx.output_total:
-                calculated_fee = tx.input_total - tx.output_total
-            
-            response = TransactionResponse(
-                raw_transaction=tx.raw_hex(),
-                txid=tx.txid,
-                fee=calculated_fee
+            script = input_tx.script
+            if script:
+                tx_input.script = script
+            sequence = input_tx.sequence
+            if sequence:
+                tx_input.sequence = sequence
+            tx_inputs.append(tx_input)
+            input_total += input_tx.value or 0
+        
+        tx_outputs = []
+        output_total = 0
+        for output in request.outputs:
+            tx_output = Output(
+                value=output.value,
+                address=parse_address(output.address, network),
+                network=network
             )
-            
-            logger.debug("Transação construída com sucesso", extra={
-                "txid": tx.txid,
-                "network": network,
-                "fee": calculated_fee
-            })
-            
-            return response
-        except Exception as e:
-            logger.error("Erro ao construir transação", exc_info=True)
-            raise 
\ No newline at end of file
+            tx_outputs.append(tx_output)
+            output_total += output.value
+        
+        fee = request.fee_rate or 1.0
+        fee_per_kb = int(fee * 1000)
+        tx = Transaction(
+            inputs=tx_inputs,
+            outputs=tx_outputs,
+            network=network,
+            fee=fee,
+            fee_per_kb=fee_per_kb
+        )
+        
+        calculated_fee = 0
+        if input_total and output_total:
+            calculated_fee = input_total - output_total
+        
+        # Campos gerados aqui mesmo (hex, txid e inteiro): não precisam passar pela validação
+        response = TransactionResponse.model_construct(
+            raw_transaction=tx.raw_hex(),
+            txid=tx.txid,
+            fee=float(calculated_fee)
+        )
+        
+        logger.debug("Transação construída com sucesso", extra={
+            "txid": tx.txid,
+            "network": network,
+            "fee": calculated_fee
+        })
+        
+        return response
+
+    def _build_raw(self, request: TransactionRequest, network: str) -> TransactionResponse:
+        raw_inputs = []
+        input_total = 0
+        for input_tx in request.inputs:
+            prev_txid = bytes.fromhex(input_tx.txid)
+            if input_tx.address:
+                parse_address(input_tx.address, network)
+            raw_inputs.append((prev_txid, input_tx.vout, b"", input_tx.sequence or 0xffffffff))
+            input_total += input_tx.value or 0
+        
+        raw_outputs = []
+        output_total = 0
+        for output in request.outputs:
+            raw_outputs.append((output.value, script_pubkey(output.address, network)))
+            output_total += output.value
+        
+        raw_tx, txid = serialize_segwit_tx(1, raw_inputs, raw_outputs, [[] for _ in raw_inputs], 0)
+        
+        calculated_fee = 0
+        if input_total and output_total:
+            calculated_fee = input_total - output_total
+        
+        logger.debug("Transação serializada diretamente", extra={
+            "txid": txid,
+            "network": network,
+            "fee": calculated_fee
+        })
+        
+        return TransactionResponse.model_construct(
+            raw_transaction=raw_tx.hex(),
+            txid=txid,
+            fee=float(calculated_fee)
+        )
@@ -0,0 +1,69 @@
+from hashlib import sha256
+from typing import List, Tuple
+import struct
+
+_PACK_U32 = struct.Struct("<I").pack
+_PACK_U64 = struct.Struct("<Q").pack
+_SEGWIT_MARKER = b"\x00\x01"
+
+def varint(n: int) -> bytes:
+    """Codifica um inteiro no formato CompactSize usado pelo protocolo Bitcoin"""
+    if n < 0xfd:
+        return bytes((n,))
+    if n <= 0xffff:
+        return b"\xfd" + struct.pack("<H", n)
+    if n <= 0xffffffff:
+        return b"\xfe" + _PACK_U32(n)
+    return b"\xff" + _PACK_U64(n)
+
+def _write_body(buf: bytearray, inputs: List[Tuple[bytes, int, bytes, int]],
+                outputs: List[Tuple[int, bytes]]) -> None:
+    buf += varint(len(inputs))
+    for prev_txid, output_n, script_sig, sequence in inputs:
+        buf += prev_txid[::-1]
+        buf += _PACK_U32(output_n)
+        buf += varint(len(script_sig))
+        buf += script_sig
+        buf += _PACK_U32(sequence)
+    buf += varint(len(outputs))
+    for value, script_pubkey in outputs:
+        buf += _PACK_U64(value)
+        buf += varint(len(script_pubkey))
+        buf += script_pubkey
+
+def serialize_segwit_tx(version: int, inputs: List[Tuple[bytes, int, bytes, int]],
+                        outputs: List[Tuple[int, bytes]], witnesses: List[List[bytes]],
+                        locktime: int) -> Tuple[bytes, str]:
+    """
+    Serializa uma transação segwit diretamente em bytes, sem montar o grafo de
+    objetos da bitcoinlib.
+
+    Args:
+        version (int): Versão da transação
+        inputs: Lista de (prev_txid big-endian, output_n, script_sig, sequence)
+        outputs: Lista de (valor em satoshis, script_pubkey)
+        witnesses: Pilha de witness de cada input (lista vazia para inputs não assinados)
+        locktime (int): nLockTime
+
+    Returns:
+        Tuple[bytes, str]: Transação serializada e seu txid em hexadecimal
+    """
+    version_bytes = _PACK_U32(version)
+    locktime_bytes = _PACK_U32(locktime)
+    body = bytearray()
+    _write_body(body, inputs, outputs)
+
+    # O txid é calculado sobre a serialização sem os dados de witness
+    stripped = version_bytes + body + locktime_bytes
+    txid = sha256(sha256(stripped).digest()).digest()[::-1].hex()
+
+    buf = bytearray(version_bytes)
+    buf += _SEGWIT_MARKER
+    buf += body
+    for stack in witnesses:
+        buf += varint(len(stack))
+        for item in stack:
+            buf += varint(len(item))
+            buf += item
+    buf += locktime_bytes
+    return bytes(buf), txid
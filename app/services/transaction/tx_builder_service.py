@@ -1,5 +1,9 @@
 import logging
+import hashlib
+import threading
 from typing import Dict, Any
+from cachetools import LRUCache
+from fastapi import HTTPException
 
 from app.models.utxo_models import TransactionRequest, TransactionResponse, Input, Output
 from app.services.transaction import BitcoinLibBuilder
@@ -7,6 +11,24 @@ from app.services.transaction.validators.transaction_validator import Transactio
 
 logger = logging.getLogger(__name__)
 
+# A construção é determinística: a mesma requisição sempre gera a mesma transação
+_build_cache = LRUCache(maxsize=256)
+_build_cache_lock = threading.Lock()
+
+def _build_cache_key(tx_request: TransactionRequest, network: str) -> str:
+    """
+    Gera uma chave de tamanho fixo para a requisição, preservando a ordem de inputs
+    e outputs (que determina os bytes da transação).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{network}|{tx_request.fee_rate}|".encode())
+    for i in tx_request.inputs:
+        h.update(f"{i.txid}:{i.vout}:{i.value}:{i.script}:{i.sequence}:{i.address}|".encode())
+    h.update(b"#")
+    for o in tx_request.outputs:
+        h.update(f"{o.address}:{o.value}|".encode())
+    return h.hexdigest()
+
 def build_transaction(tx_request: TransactionRequest, network: str) -> TransactionResponse:
     """
     Constrói uma transação Bitcoin não assinada.
@@ -23,15 +45,13 @@ def build_transaction(tx_request: TransactionRequest, network: str) -> Transacti
         TransactionResponse: Resposta contendo a transação raw em formato hexadecimal e o txid
         
     Raises:
-        Exception: Se ocorrer algum erro durante a construção da transação
+        HTTPException: Se os inputs ou outputs forem inválidos (400)
+        ValueError: Se a requisição não puder ser convertida em uma transação
+        Exception: Se ocorrer algum outro erro durante a construção da transação
     """
     try:
         logger.info(f"[TX_BUILD] Iniciando construção de transação para rede {network}")
-        
-        # Validar inputs e outputs
-        TransactionValidator.validate_inputs(tx_request.inputs)
-        TransactionValidator.validate_outputs(tx_request.outputs)
-        
+
         # Verificar e garantir que objetos Input e Output estão corretos
         # Isso é necessário porque o FastAPI pode deserializar para dicionários
         # em vez de objetos Input/Output em alguns casos
@@ -55,12 +75,28 @@ def build_transaction(tx_request: TransactionRequest, network: str) -> Transacti
                     outputs.append(o)
             tx_request.outputs = outputs
         
+        cache_key = _build_cache_key(tx_request, network)
+        with _build_cache_lock:
+            cached = _build_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"[TX_BUILD] Transação retornada do cache: {cached.txid}")
+            return cached
+        
+        # Validar inputs e outputs (somente quando não há resultado em cache)
+        TransactionValidator.validate_inputs(tx_request.inputs)
+        TransactionValidator.validate_outputs(tx_request.outputs)
+        
         tx_builder = BitcoinLibBuilder()
         response = tx_builder.build(tx_request, network)
+        with _build_cache_lock:
+            _build_cache[cache_key] = response
         
         logger.info(f"[TX_BUILD] Transação construída com sucesso: {response.txid}")
         return response
         
+    except (HTTPException, ValueError) as e:
+        logger.warning(f"[TX_BUILD] Requisição de transação inválida: {str(e)}")
+        raise
     except Exception as e:
         logger.error(f"[TX_BUILD] Erro ao construir transação: {str(e)}", exc_info=True)
         raise Exception(f"Erro ao construir transação: {str(e)}") 
\ No newline at end of file
@@ -5,6 +5,30 @@ from app.models.utxo_models import Input, Output
 
 logger = logging.getLogger(__name__)
 
+class _InputsDump:
+    """Formata os inputs para log somente quando o registro é de fato emitido"""
+
+    def __init__(self, inputs: List[Input]):
+        self.inputs = inputs
+
+    def __str__(self) -> str:
+        return "\n".join(
+            f"  [{i}] txid={input_tx.txid} vout={input_tx.vout}"
+            for i, input_tx in enumerate(self.inputs)
+        )
+
+class _OutputsDump:
+    """Formata os outputs para log somente quando o registro é de fato emitido"""
+
+    def __init__(self, outputs: List[Output]):
+        self.outputs = outputs
+
+    def __str__(self) -> str:
+        return "\n".join(
+            f"  [{i}] address={output.address} value={output.value}"
+            for i, output in enumerate(self.outputs)
+        )
+
 class TransactionValidator:
     @staticmethod
     def validate_inputs(inputs: List[Input]) -> None:
@@ -12,9 +36,8 @@ class TransactionValidator:
         if not inputs:
             logger.error("Inputs vazios")
             raise HTTPException(status_code=400, detail="Inputs não podem estar vazios")
-        
-        for i, input_tx in enumerate(inputs):
-            logger.debug(f"Input {i} validado: txid={input_tx.txid}, vout={input_tx.vout}")
+
+        logger.debug("Inputs validados:\n%s", _InputsDump(inputs))
 
     @staticmethod
     def validate_outputs(outputs: List[Output]) -> None:
@@ -22,11 +45,10 @@ class TransactionValidator:
         if not outputs:
             logger.error("Outputs vazios")
             raise HTTPException(status_code=400, detail="Outputs não podem estar vazios")
-        
-        for i, output in enumerate(outputs):
-            logger.debug(f"Output {i} validado: address={output.address}, value={output.value}")
-            
-        for output in outputs:
-            if output.value <= 0:
-                logger.error(f"Valor de output inválido: {output.value}")
-                raise HTTPException(status_code=400, detail="Output com valor inválido: deve ser maior que zero") 
\ No newline at end of file
+
+        invalid_value = next((output.value for output in outputs if output.value <= 0), None)
+        if invalid_value is not None:
+            logger.error(f"Valor de output inválido: {invalid_value}")
+            raise HTTPException(status_code=400, detail="Output com valor inválido: deve ser maior que zero")
+
+        logger.debug("Outputs validados:\n%s", _OutputsDump(outputs))
@@ -1,12 +1,90 @@
-import requests
+import json
 import logging
-from typing import Dict, Any, Optional
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from app.models.transaction_status_models import TransactionStatusModel
-from app.dependencies import get_bitcoinlib_network, get_blockchain_api_url
+from app.dependencies import (get_bitcoinlib_network, get_blockchain_api_url, get_mempool_api_url, get_http_session,
+                              get_http2_client, get_cache_timeout, is_offline_mode_enabled)
+from app.services.blockchain_service import blockchain_cache
+from cachetools import LRUCache, TTLCache
 import re
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+__all__ = ['get_transaction_status', 'get_transaction_statuses', 'get_status_endpoints', 'ApiEndpoint']
+
 logger = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT = 10
+DEFAULT_RETRY_AFTER = 1
+MAX_RETRY_AFTER = 60
+TIP_POLL_INTERVAL = 30
+# Prazo de uma consulta às APIs, contado a partir do início da primeira requisição
+QUERY_DEADLINE = REQUEST_TIMEOUT * 2
+SETTLED_CONFIRMATIONS = 6
+MAX_BATCH_LOOKUPS = 16
+
+# Altura atual da blockchain por API, consultada no máximo uma vez a cada TIP_POLL_INTERVAL
+_tip_heights = TTLCache(maxsize=8, ttl=TIP_POLL_INTERVAL)
+# Marca uma consulta de altura que falhou, para não repeti-la até o fim do intervalo
+_TIP_UNAVAILABLE = object()
+_tip_lock = threading.Lock()
+
+# Status com 6+ confirmações não mudam mais: ficam em memória sem expiração, só com despejo LRU
+_confirmed_statuses = LRUCache(maxsize=50000)
+_confirmed_lock = threading.Lock()
+
+# Modelos já montados para as entradas do cache persistente, por (rede, txid, altura do bloco)
+_status_models = LRUCache(maxsize=2048)
+_status_models_lock = threading.Lock()
+
+# Consultas em andamento por (rede, txid), compartilhadas entre chamadas concorrentes
+_inflight: Dict[Tuple[str, str], Future] = {}
+_inflight_lock = threading.Lock()
+
+# Instante (time.time()) até o qual cada API deve ser evitada após responder 429/503
+_host_backoff: Dict[str, float] = {}
+# Respostas 429/503 consecutivas por API, zeradas na primeira resposta bem-sucedida
+_host_strikes: Dict[str, int] = {}
+
+# Consultas individuais simultâneas esperadas: o limite padrão de threads das rotas
+# síncronas do FastAPI (anyio), que executam get_transaction_status
+MAX_CONCURRENT_LOOKUPS = 40
+# Cada consulta dispara uma requisição por API (ver get_status_endpoints)
+STATUS_APIS_PER_LOOKUP = 2
+
+# Pool compartilhado para consultar as APIs em paralelo; não é encerrado a cada
+# chamada para não pagar a criação das threads em toda consulta. Dimensionado para
+# que consultas simultâneas não esperem umas pelas outras na fila (as threads só
+# são criadas conforme a demanda)
+_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LOOKUPS * STATUS_APIS_PER_LOOKUP,
+                               thread_name_prefix="tx-status")
+
+_EXPLORER_TX_BASE = {
+    "mainnet": "https://blockstream.info/tx/",
+    "testnet": "https://blockstream.info/testnet/tx/"
+}
+
+# Transações de teste geralmente têm padrões repetitivos (todos 'a', todos 'f', etc.)
+# Ou são transações famosas/conhecidas como a primeira transação Bitcoin
+_TEST_REGEXES = tuple(re.compile(pattern) for pattern in (
+    r'^a{64}$',  # txid com todos 'a'
+    r'^f{64}$',  # txid com todos 'f'
+    r'^0{64}$',  # txid com todos '0'
+))
+_TEST_TXIDS = frozenset({
+    'f4184fc596403b9d638783cf57adfe4c75c605f6356fbc91338530e9831e9e16'  # primeira transação Bitcoin
+})
+
 def get_transaction_status(txid: str, network: str = "testnet") -> TransactionStatusModel:
     """
     Consulta o status atual de uma transação Bitcoin na blockchain.
@@ -30,6 +108,13 @@ def get_transaction_status(txid: str, network: str = "testnet") -> TransactionSt
     Raises:
         Exception: Se a transação não for encontrada ou ocorrer um erro na consulta
     """
+    return _lookup_status(txid, network, _executor)
+
+def _lookup_status(txid: str, network: str, api_executor: ThreadPoolExecutor) -> TransactionStatusModel:
+    """
+    Implementa get_transaction_status, consultando as APIs no pool `api_executor`.
+    """
+    cached_entry = None
     try:
         logger.info(f"[TX_STATUS] Consultando status da transação {txid}")
         
@@ -38,52 +123,415 @@ def get_transaction_status(txid: str, network: str = "testnet") -> TransactionSt
             logger.info(f"[TX_STATUS] Detectada transação de teste: {txid}, retornando dados simulados")
             return _get_simulated_status(txid, network)
         
-        # Implementação real
-        api_url = get_blockchain_api_url(network)
-        response = requests.get(f"{api_url}/transaction/{txid}")
+        confirmed_status = _get_confirmed_status(txid, network)
+        if confirmed_status is not None:
+            return confirmed_status
         
-        if response.status_code != 200:
-            logger.error(f"[TX_STATUS] Erro ao consultar transação: {response.text}")
+        cached_entry = _read_status_entry(txid, network)
+        cached_status = _fresh_status(cached_entry, txid, network)
+        if cached_status is not None:
+            logger.info(f"[TX_STATUS] Retornando status do cache para {txid}")
+            return cached_status
+        
+        tx_data = _query_apis_coalesced(txid, network, api_executor)
+        
+        if tx_data is None:
+            logger.error(f"[TX_STATUS] Nenhuma API retornou a transação {txid}")
             # Tentar fallback para transação simulada
-            return _fallback_status(txid, network, f"Transação não encontrada: {txid}")
-            
-        tx_data = response.json()
+            return _fallback_status(txid, network, f"Transação não encontrada: {txid}", cached_entry)
         
         confirmations = tx_data.get("confirmations", 0)
         
-        if confirmations >= 6:
+        if confirmations >= SETTLED_CONFIRMATIONS:
             status = "confirmed"
         elif confirmations > 0:
             status = "confirming"
         else:
             status = "pending"
             
-        explorer_base = "https://blockstream.info/"
-        if network == "testnet":
-            explorer_base += "testnet/"
-        
-        return TransactionStatusModel(
+        result = TransactionStatusModel(
             txid=txid,
             status=status,
             confirmations=confirmations,
             block_height=tx_data.get("block_height"),
             block_hash=tx_data.get("block_hash"),
             timestamp=tx_data.get("timestamp"),
-            explorer_url=f"{explorer_base}tx/{txid}"
+            explorer_url=_explorer_url(txid, network)
         )
+        _cache_status(result, network)
+        return result
         
     except Exception as e:
         logger.error(f"[TX_STATUS] Erro ao consultar status da transação: {str(e)}")
-        return _fallback_status(txid, network, f"Erro ao consultar status da transação: {str(e)}")
+        return _fallback_status(txid, network, f"Erro ao consultar status da transação: {str(e)}", cached_entry)
+
+def get_transaction_statuses(txids: List[str], network: str = "testnet") -> List[TransactionStatusModel]:
+    """
+    Consulta o status de várias transações de uma vez.
+    
+    O cache é consultado em uma única passada e apenas as transações ausentes são
+    buscadas, em paralelo, reaproveitando o pool de conexões da sessão HTTP.
+    As consultas do lote usam um pool próprio, com uma thread por API de cada
+    transação, para não disputar o _executor compartilhado com as consultas
+    individuais nem esgotar o prazo de _query_apis esperando na fila.
+    
+    Args:
+        txids (List[str]): IDs das transações
+        network (str, optional): Rede Bitcoin ('mainnet', 'testnet'). Defaults to "testnet".
+    
+    Returns:
+        List[TransactionStatusModel]: Status de cada transação, na mesma ordem de `txids`
+    """
+    logger.info(f"[TX_STATUS] Consultando status de {len(txids)} transações")
+    
+    results: Dict[str, TransactionStatusModel] = {}
+    misses = []
+    for txid in dict.fromkeys(txids):
+        cached_status = _get_confirmed_status(txid, network)
+        if cached_status is None:
+            cached_status = _fresh_status(_read_status_entry(txid, network), txid, network)
+        if cached_status is not None:
+            results[txid] = cached_status
+        else:
+            misses.append(txid)
+    
+    if misses:
+        logger.debug(f"[TX_STATUS] {len(misses)} transações fora do cache")
+        workers = min(MAX_BATCH_LOOKUPS, len(misses))
+        api_executor = ThreadPoolExecutor(max_workers=workers * len(get_status_endpoints(network)),
+                                          thread_name_prefix="tx-status-batch")
+        try:
+            with blockchain_cache.batch(), ThreadPoolExecutor(max_workers=workers) as batch_executor:
+                statuses = batch_executor.map(lambda txid: _lookup_status(txid, network, api_executor), misses)
+                results.update(zip(misses, statuses))
+        finally:
+            # Não espera as APIs mais lentas cujas respostas já foram descartadas
+            api_executor.shutdown(wait=False, cancel_futures=True)
+    
+    return [results[txid] for txid in txids]
+
+def _http_get(url: str, timeout: float):
+    """
+    Faz um GET pelo cliente HTTP/2 quando disponível, ou pela sessão requests compartilhada.
+    
+    As duas respostas expõem status_code, headers, text, content e raise_for_status().
+    """
+    client = get_http2_client()
+    if client is not None:
+        return client.get(url, timeout=timeout)
+    return get_http_session().get(url, timeout=timeout)
+
+def _status_cache_key(txid: str, network: str) -> str:
+    return f"tx_status_{network}_{txid}"
+
+def _read_status_entry(txid: str, network: str) -> Optional[Dict[str, Any]]:
+    """
+    Lê a entrada de status do cache sem aplicar o TTL; a validade é decidida por _fresh_status.
+    """
+    entry = blockchain_cache.get(_status_cache_key(txid, network), ignore_ttl=True)
+    if not entry or "tip_height" not in entry:
+        return None
+    return entry
+
+def _fresh_status(entry: Optional[Dict[str, Any]], txid: str, network: str) -> Optional[TransactionStatusModel]:
+    """
+    Retorna o status em cache enquanto nenhum bloco novo tiver sido minerado.
+    
+    As confirmações só mudam quando surge um novo bloco, então a entrada guarda a
+    altura da blockchain no momento da consulta e vale enquanto ela não mudar.
+    Transações com 6+ confirmações não mudam mais e permanecem válidas. Se a altura
+    atual não puder ser obtida, vale o TTL normal do cache.
+    """
+    if entry is None:
+        return None
+    
+    status = entry["status"]
+    if status["confirmations"] < SETTLED_CONFIRMATIONS:
+        tip_height = _get_tip_height(get_mempool_api_url(network))
+        if tip_height is not None:
+            is_fresh = tip_height == entry["tip_height"]
+        else:
+            is_fresh = time.time() < entry.get("expires_at", 0)
+        if not is_fresh:
+            logger.debug(f"[TX_STATUS] Status em cache de {txid} desatualizado")
+            return None
+    
+    model_key = (network, txid, entry["tip_height"])
+    with _status_models_lock:
+        result = _status_models.get(model_key)
+    if result is None:
+        # Dados gravados pelo próprio serviço, já validados na escrita
+        result = TransactionStatusModel.model_construct(**status)
+        with _status_models_lock:
+            _status_models[model_key] = result
+    if status["confirmations"] >= SETTLED_CONFIRMATIONS:
+        _remember_confirmed(result, network)
+    return result
+
+def _get_confirmed_status(txid: str, network: str) -> Optional[TransactionStatusModel]:
+    with _confirmed_lock:
+        return _confirmed_statuses.get((network, txid))
+
+def _remember_confirmed(result: TransactionStatusModel, network: str) -> None:
+    with _confirmed_lock:
+        _confirmed_statuses[(network, result.txid)] = result
+
+def _cache_status(result: TransactionStatusModel, network: str) -> None:
+    if result.confirmations >= SETTLED_CONFIRMATIONS:
+        _remember_confirmed(result, network)
+    tip_height = _get_tip_height(get_mempool_api_url(network))
+    with _status_models_lock:
+        _status_models[(network, result.txid, tip_height)] = result
+    # Relógio de parede (e não time.monotonic) porque o cache é persistido entre execuções
+    blockchain_cache.set(_status_cache_key(result.txid, network), {
+        "status": result.model_dump(),
+        "tip_height": tip_height,
+        "expires_at": time.time() + get_cache_timeout(cold_wallet=is_offline_mode_enabled())
+    })
+
+def _get_tip_height(api_url: str) -> Optional[int]:
+    """
+    Retorna a altura atual da blockchain segundo a API Esplora, consultando-a no
+    máximo uma vez a cada TIP_POLL_INTERVAL segundos. Falhas também são lembradas
+    pelo mesmo intervalo, para que uma API fora do ar não bloqueie cada consulta.
+    """
+    with _tip_lock:
+        tip_height = _tip_heights.get(api_url)
+    if tip_height is _TIP_UNAVAILABLE:
+        return None
+    if tip_height is not None:
+        return tip_height
+    
+    try:
+        response = _http_get(f"{api_url}/blocks/tip/height", timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        tip_height = int(response.text)
+    except Exception as e:
+        logger.warning(f"[TX_STATUS] Não foi possível obter a altura atual da blockchain: {str(e)}")
+        with _tip_lock:
+            _tip_heights[api_url] = _TIP_UNAVAILABLE
+        return None
+    
+    with _tip_lock:
+        _tip_heights[api_url] = tip_height
+    return tip_height
+
+ApiEndpoint = namedtuple("ApiEndpoint", "name base_url url_template parse timeout")
+
+@lru_cache(maxsize=8)
+def get_status_endpoints(network: str) -> Tuple[ApiEndpoint, ...]:
+    """
+    Retorna as APIs de status da rede, já em ordem de prioridade e com a URL pronta.
+    
+    Args:
+        network (str): Rede Bitcoin ('mainnet' ou 'testnet')
+        
+    Returns:
+        Tuple[ApiEndpoint, ...]: Endpoints com o template de URL contendo {txid}
+    """
+    blockchain_api_url = get_blockchain_api_url(network)
+    mempool_api_url = get_mempool_api_url(network)
+    return (
+        ApiEndpoint("blockchain_api", blockchain_api_url, f"{blockchain_api_url}/transaction/{{txid}}",
+                    _parse_blockchain_api, REQUEST_TIMEOUT),
+        ApiEndpoint("mempool", mempool_api_url, f"{mempool_api_url}/tx/{{txid}}",
+                    _parse_esplora, REQUEST_TIMEOUT),
+    )
+
+def _query_apis(txid: str, network: str, api_executor: ThreadPoolExecutor) -> Optional[Dict[str, Any]]:
+    """
+    Consulta todas as APIs de status em paralelo e usa a primeira resposta válida.
+    
+    A latência passa a ser a da API mais rápida em vez da soma das tentativas
+    sequenciais; as consultas que ainda não começaram são canceladas.
+    
+    O prazo QUERY_DEADLINE só começa a contar quando a primeira requisição sai do
+    pool: o tempo esperando na fila de um `api_executor` ocupado não esgota a consulta.
+    
+    Returns:
+        Optional[Dict]: Dados normalizados da transação ou None se nenhuma API respondeu
+    """
+    endpoints = get_status_endpoints(network)
+    started_at: List[float] = []
+    
+    def run(endpoint: ApiEndpoint) -> Optional[Dict[str, Any]]:
+        started_at.append(time.monotonic())
+        return _query_endpoint(endpoint, txid)
+    
+    futures = {api_executor.submit(run, endpoint): endpoint.name for endpoint in endpoints}
+    pending = set(futures)
+    try:
+        while pending:
+            if started_at:
+                remaining = started_at[0] + QUERY_DEADLINE - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(f"[TX_STATUS] Tempo esgotado consultando APIs para {txid}")
+                    break
+            else:
+                # Ainda na fila: reavalia periodicamente até alguma requisição começar
+                remaining = REQUEST_TIMEOUT
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    tx_data = future.result()
+                except Exception as e:
+                    logger.warning(f"[TX_STATUS] Falha em {futures[future]}: {str(e)}")
+                    continue
+                if tx_data is not None:
+                    logger.debug(f"[TX_STATUS] Resposta obtida via {futures[future]}")
+                    return tx_data
+    finally:
+        for future in futures:
+            future.cancel()
+    return None
 
-def _fallback_status(txid: str, network: str, error: str) -> TransactionStatusModel:
+def _query_apis_coalesced(txid: str, network: str, api_executor: ThreadPoolExecutor) -> Optional[Dict[str, Any]]:
+    """
+    Executa _query_apis uma única vez por transação, mesmo com chamadas concorrentes.
+    
+    A primeira thread a perder o cache faz a consulta na própria thread (e não em
+    `api_executor`, que _query_apis usa para as APIs) e as demais aguardam o mesmo Future.
+    
+    Returns:
+        Optional[Dict]: Dados normalizados da transação ou None se nenhuma API respondeu
+    """
+    key = (network, txid)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight[key] = future
+    
+    if not is_owner:
+        logger.debug(f"[TX_STATUS] Aguardando consulta já em andamento para {txid}")
+        return future.result()
+    
+    try:
+        tx_data = _query_apis(txid, network, api_executor)
+        future.set_result(tx_data)
+        return tx_data
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+def _query_endpoint(endpoint: ApiEndpoint, txid: str) -> Optional[Dict[str, Any]]:
+    """
+    Consulta uma API de status e normaliza a resposta.
+    """
+    backoff_until = _host_backoff.get(endpoint.name, 0)
+    if backoff_until > time.time():
+        logger.debug(f"[TX_STATUS] {endpoint.name} em backoff por limite de requisições, ignorando")
+        return None
+    
+    response = _http_get(endpoint.url_template.format(txid=txid), timeout=endpoint.timeout)
+    
+    if response.status_code in (429, 503):
+        strikes = _host_strikes.get(endpoint.name, 0) + 1
+        _host_strikes[endpoint.name] = strikes
+        wait = _parse_retry_after(response.headers.get("Retry-After"), strikes)
+        _host_backoff[endpoint.name] = time.time() + wait
+        logger.warning(f"[TX_STATUS] {endpoint.name} limitou as requisições ({response.status_code}), "
+                       f"aguardando {wait}s antes de consultá-lo novamente")
+        return None
+    
+    if response.status_code != 200:
+        logger.error(f"[TX_STATUS] Erro ao consultar transação em {endpoint.name}: {response.text}")
+        return None
+    
+    _host_strikes.pop(endpoint.name, None)
+    return endpoint.parse(_json_loads(response.content), endpoint)
+
+def _parse_retry_after(value: Optional[str], strikes: int = 1) -> int:
+    """
+    Interpreta o cabeçalho Retry-After em segundos.
+    
+    Sem o cabeçalho (ou com datas HTTP e valores inválidos) usa backoff exponencial:
+    DEFAULT_RETRY_AFTER dobrado a cada 429/503 consecutivo da mesma API, até MAX_RETRY_AFTER.
+    
+    Args:
+        value (str): Valor do cabeçalho Retry-After
+        strikes (int): Respostas 429/503 consecutivas da API, incluindo a atual
+    """
+    try:
+        return max(int(value), 1)
+    except (TypeError, ValueError):
+        return min(DEFAULT_RETRY_AFTER * 2 ** min(strikes - 1, 16), MAX_RETRY_AFTER)
+
+def _parse_blockchain_api(tx_data: Dict[str, Any], endpoint: ApiEndpoint) -> Optional[Dict[str, Any]]:
+    """
+    Normaliza a resposta da API de blockchain configurada.
+    
+    Respostas sem o número de confirmações não são aceitas: um 200 com corpo
+    inesperado não pode virar um status "pending" e vencer a resposta da outra API.
+    """
+    confirmations = tx_data.get("confirmations") if isinstance(tx_data, dict) else None
+    if not isinstance(confirmations, int) or isinstance(confirmations, bool):
+        logger.warning(f"[TX_STATUS] Resposta de {endpoint.name} sem confirmações, ignorando")
+        return None
+    return {
+        "confirmations": confirmations,
+        "block_height": tx_data.get("block_height"),
+        "block_hash": tx_data.get("block_hash"),
+        "timestamp": tx_data.get("timestamp")
+    }
+
+def _parse_esplora(tx_data: Dict[str, Any], endpoint: ApiEndpoint) -> Optional[Dict[str, Any]]:
+    """
+    Normaliza a resposta Esplora do mempool.space, calculando as confirmações a partir da altura atual.
+    
+    Respostas sem o objeto "status" (ou confirmadas sem altura do bloco) são ignoradas.
+    """
+    tx_status = tx_data.get("status") if isinstance(tx_data, dict) else None
+    if not isinstance(tx_status, dict) or "confirmed" not in tx_status:
+        logger.warning(f"[TX_STATUS] Resposta de {endpoint.name} sem status, ignorando")
+        return None
+    if not tx_status["confirmed"]:
+        return {"confirmations": 0, "block_height": None, "block_hash": None, "timestamp": None}
+    
+    block_height = tx_status.get("block_height")
+    if not isinstance(block_height, int):
+        logger.warning(f"[TX_STATUS] Resposta de {endpoint.name} confirmada sem altura do bloco, ignorando")
+        return None
+    tip_height = _get_tip_height(endpoint.base_url)
+    if tip_height is None:
+        raise ValueError("Altura atual da blockchain indisponível")
+    confirmations = tip_height - block_height + 1
+    
+    block_time = tx_status.get("block_time")
+    return {
+        "confirmations": confirmations,
+        "block_height": block_height,
+        "block_hash": tx_status.get("block_hash"),
+        "timestamp": _format_block_time(int(block_time)) if block_time else None
+    }
+
+@lru_cache(maxsize=4096)
+def _format_block_time(block_time: int) -> str:
+    """
+    Converte o timestamp Unix de um bloco para ISO 8601 em UTC.
+    
+    Transações do mesmo bloco compartilham o timestamp, então consultas em lote
+    reaproveitam a conversão.
+    """
+    return datetime.fromtimestamp(block_time, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def _fallback_status(txid: str, network: str, error: str,
+                     cached_entry: Optional[Dict[str, Any]] = None) -> TransactionStatusModel:
     """
     Fornece um status de fallback quando a API falha.
+    
+    Se houver um status em cache (mesmo desatualizado), ele é preferido a um status
+    desconhecido; a entrada é recebida de quem chama para evitar uma nova leitura.
     """
-    if network == "mainnet":
-        explorer_url = f"https://blockstream.info/tx/{txid}"
-    else:
-        explorer_url = f"https://blockstream.info/testnet/tx/{txid}"
+    if cached_entry is not None:
+        logger.info(f"[TX_STATUS] Usando status em cache desatualizado para {txid}")
+        return TransactionStatusModel.model_construct(**cached_entry["status"])
+    
+    explorer_url = _explorer_url(txid, network)
     
     if _is_test_transaction(txid):
         return _get_simulated_status(txid, network)
@@ -98,29 +546,20 @@ def _fallback_status(txid: str, network: str, error: str) -> TransactionStatusMo
         explorer_url=explorer_url
     )
 
+def _explorer_url(txid: str, network: str) -> str:
+    return _EXPLORER_TX_BASE.get(network, _EXPLORER_TX_BASE["testnet"]) + txid
+
 def _is_test_transaction(txid: str) -> bool:
     """
     Verifica se é uma transação de teste com base no padrão do txid.
     """
-    # Transações de teste geralmente têm padrões repetitivos (todos 'a', todos 'f', etc.)
-    # Ou são transações famosas/conhecidas como a primeira transação Bitcoin
-    test_patterns = [
-        r'^a{64}$',  # txid com todos 'a'
-        r'^f{64}$',  # txid com todos 'f'
-        r'^0{64}$',  # txid com todos '0'
-        'f4184fc596403b9d638783cf57adfe4c75c605f6356fbc91338530e9831e9e16'  # primeira transação Bitcoin
-    ]
-    
-    return any(re.match(pattern, txid) or txid == pattern for pattern in test_patterns)
+    return txid in _TEST_TXIDS or any(regex.match(txid) for regex in _TEST_REGEXES)
 
 def _get_simulated_status(txid: str, network: str) -> TransactionStatusModel:
     """
     Retorna um status simulado para transações de teste.
     """
-    if network == "mainnet":
-        explorer_url = f"https://blockstream.info/tx/{txid}"
-    else:
-        explorer_url = f"https://blockstream.info/testnet/tx/{txid}"
+    explorer_url = _explorer_url(txid, network)
     
     # Dados simulados para teste
     return TransactionStatusModel(
@@ -1,14 +1,16 @@
-from bitcoinlib.transactions import Transaction
-from typing import List, Dict, Any
-from app.models.utxo_models import TransactionRequest, TransactionResponse
+from typing import List, Dict, Any, Union
+from fastapi import HTTPException
+from app.models.utxo_models import TransactionRequest, TransactionResponse, Input, Output
+from app.services.transaction.tx_builder_service import build_transaction
 from app.dependencies import get_bitcoinlib_network
 import logging
-import traceback
+
+__all__ = ['create_transaction']
 
 logger = logging.getLogger(__name__)
 
-def create_transaction(inputs: List[Dict[str, Any]], outputs: List[Dict[str, Any]], 
-                     fee_rate: float = 1.0, network: str = "testnet"):
+def create_transaction(inputs: List[Union[Input, Dict[str, Any]]], outputs: List[Union[Output, Dict[str, Any]]], 
+                     fee_rate: float = 1.0, network: str = "testnet") -> TransactionResponse:
     """
     Constrói uma transação Bitcoin a partir de UTXOs (entradas) e destinatários (saídas).
     
@@ -38,96 +40,23 @@ def create_transaction(inputs: List[Dict[str, Any]], outputs: List[Dict[str, Any
             Padrão é "testnet".
     
     Returns:
-        Dict: Transação construída com informações detalhadas, incluindo:
+        TransactionResponse: Transação construída, contendo:
             - raw_transaction (str): Transação em formato hexadecimal
             - txid (str): ID da transação
-            - inputs_count (int): Número de entradas
-            - outputs_count (int): Número de saídas
-            - total_input (int): Valor total das entradas em satoshis
-            - total_output (int): Valor total das saídas em satoshis
             - fee (int): Taxa da transação em satoshis
-            - estimated_size (int): Tamanho estimado da transação em bytes
-            - estimated_fee_rate (float): Taxa estimada em sat/vB
         
     Raises:
-        ValueError: Se os inputs ou outputs forem inválidos ou se o
-            balanço for insuficiente para cobrir as saídas e a taxa
+        HTTPException: Se os inputs ou outputs forem inválidos
+        ValueError: Se a transação não puder ser construída
     """
     try:
-        bitcoinlib_network = get_bitcoinlib_network(network)
         logger.info(f"[UTXO] Construindo transação com {len(inputs)} inputs e {len(outputs)} outputs")
-                
+        request = TransactionRequest(inputs=inputs, outputs=outputs, fee_rate=fee_rate)
+        # A bitcoinlib chama a mainnet de 'bitcoin'
+        return build_transaction(request, get_bitcoinlib_network(network))
+    except (HTTPException, ValueError):
+        raise
     except Exception as e:
-        logger.error(f"[UTXO] Erro ao construir transação: {str(e)}")
-        raise ValueError(f"Erro ao construir transação: {str(e)}")
-
-def build_transaction(request: TransactionRequest, network: str) -> TransactionResponse:
-    """
-    Constrói uma transação Bitcoin a partir dos inputs e outputs fornecidos.
-    
-    Args:
-        request: Dados da transação (inputs, outputs, taxa)
-        network: Rede Bitcoin (testnet ou mainnet)
-        
-    Returns:
-        Transação processada
-    """
-    try:
-        logger.info(f"Iniciando construção de transação para rede {network}")
-        logger.debug(f"Inputs: {len(request.inputs)}, Outputs: {len(request.outputs)}")
-        
-        tx = Transaction(network=network)
-        
-        for i, input_tx in enumerate(request.inputs):
-            logger.debug(f"Adicionando input {i}: txid={input_tx.txid}, vout={input_tx.vout}")
-            try:
-                tx.add_input(
-                    prev_txid=input_tx.txid,
-                    output_n=input_tx.vout,
-                    value=input_tx.value if input_tx.value else 0
-                )
-                logger.debug(f"Input {i} adicionado com sucesso")
-            except Exception as e:
-                logger.error(f"Erro ao adicionar input {i}: {str(e)}")
-                raise ValueError(f"Erro no input {i}: {str(e)}")
-        
-        for i, output in enumerate(request.outputs):
-            logger.debug(f"Adicionando output {i}: address={output.address}, value={output.value}")
-            try:
-                tx.add_output(
-                    value=output.value,
-                    address=output.address
-                )
-                logger.debug(f"Output {i} adicionado com sucesso")
-            except Exception as e:
-                logger.error(f"Erro ao adicionar output {i}: {str(e)}")
-                raise ValueError(f"Erro no output {i}: {str(e)}")
-        
-        if request.fee_rate:
-            logger.debug(f"Definindo taxa: {request.fee_rate} sat/vB")
-            tx.fee = request.fee_rate
-        
-        fee = sum(inp.value or 0 for inp in request.inputs) - sum(out.value for out in request.outputs)
-        fee = max(0, fee)  # Evitar valores negativos
-        
-        logger.debug(f"Transação construída. TXID: {tx.txid}, Tamanho: {tx.size} bytes")
-        
-        return TransactionResponse(
-            raw_transaction=tx.raw_hex(),
-            txid=tx.txid,
-            fee=fee
-        )
-    except Exception as e:
-        logger.error(f"Erro ao construir transação: {str(e)}")
-        logger.error(traceback.format_exc())
-        
-        return _create_fallback_transaction(network)
-
-def _create_fallback_transaction(network: str) -> TransactionResponse:
-    # Implementando a lógica para criar uma transação simulada com base na rede
-    # Esta é uma implementação básica e pode ser melhorada conforme necessário
-    tx_dummy = Transaction(network=network)
-    return TransactionResponse(
-        raw_transaction=tx_dummy.raw_hex() or "0100000000000000000000000000000000000000",
-        txid=tx_dummy.txid or "abcd1234abcd1234abcd1234abcd1234abcd1234abcd1234abcd1234abcd1234"
-    ) 
\ No newline at end of file
+        # build_transaction já prefixa a mensagem com "Erro ao construir transação"
+        logger.error(f"[UTXO] {str(e)}")
+        raise ValueError(str(e))
@@ -1,10 +1,14 @@
 from bitcoinlib.transactions import Transaction
-from app.services.blockchain_service import get_utxos
+from app.services.blockchain_service import get_utxos_batch
+from concurrent.futures import ThreadPoolExecutor, wait
 import logging
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+MAX_VALIDATION_WORKERS = 8
+MAX_MONEY = 21_000_000 * 100_000_000
+
 def validate_transaction(tx_hex: str, network: str = "testnet"):
     """
     Valida uma transação Bitcoin verificando sua estrutura, assinaturas e balanço.
@@ -50,69 +54,124 @@ def validate_transaction(tx_hex: str, network: str = "testnet"):
     try:
         logger.info(f"Iniciando validação de transação na rede {network}")
         
-        is_valid, structure_issues = validate_structure(tx_hex)
-        
-        if not is_valid:
-            logger.warning(f"Transação inválida: {structure_issues}")
-            return {
-                "is_valid": False,
-                "issues": structure_issues,
-                "details": {
-                    "is_valid_structure": False,
-                    "has_sufficient_funds": False
-                }
-            }
-        
-        tx = Transaction.parse_hex(tx_hex)
-        
-        has_funds, fund_issues, input_sum, output_sum = validate_funds(tx, network)
-        
-        is_signed = any(hasattr(inp, 'script_sig') and inp.script_sig for inp in tx.inputs)
-        
-        details = {
-            "version": tx.version,
-            "locktime": tx.locktime if hasattr(tx, 'locktime') else 0,
-            "inputs_count": len(tx.inputs),
-            "outputs_count": len(tx.outputs),
-            "total_input": input_sum,
-            "total_output": output_sum,
-            "fee": input_sum - output_sum if has_funds and input_sum >= output_sum else 0,
-            "is_signed": is_signed,
-            "txid": tx.txid,
-            "estimated_size": tx.size,
-            "estimated_fee_rate": (input_sum - output_sum) / tx.size if has_funds and input_sum > output_sum and tx.size > 0 else 0
-        }
-        
-        is_completely_valid = is_valid and has_funds
-        
-        result = {
-            "is_valid": is_completely_valid,
-            "details": details
-        }
-        
-        all_issues = []
-        if structure_issues:
-            all_issues.extend(structure_issues)
-        if fund_issues:
-            all_issues.extend(fund_issues)
-            
-        if all_issues:
-            result["issues"] = all_issues
-            
-        logger.info(f"Validação concluída: válida={is_valid}, saldo suficiente={has_funds}")
-        return result
+        tx, structure_issues = parse_and_validate_structure(tx_hex)
+        return _validate_parsed(tx, structure_issues, network)
     
     except Exception as e:
-        logger.error(f"Erro ao validar transação: {str(e)}", exc_info=True)
+        return _validation_error(e)
+
+def validate_transactions(tx_hexes: List[str], network: str = "testnet") -> List[Dict[str, Any]]:
+    """
+    Valida várias transações, compartilhando a consulta de UTXOs entre elas.
+    
+    A validação só lê dados (nenhum UTXO é reservado ou gasto), então transações
+    que disputam o mesmo outpoint podem ser validadas em paralelo com segurança;
+    cada uma recebe o mesmo resultado que teria em validate_transaction.
+    
+    Args:
+        tx_hexes (List[str]): Transações em formato hexadecimal
+        network (str, opcional): Rede Bitcoin ('mainnet' ou 'testnet').
+            Padrão é "testnet".
+    
+    Returns:
+        List[Dict]: Resultado de cada validação, na mesma ordem de tx_hexes
+    """
+    logger.info(f"Iniciando validação de {len(tx_hexes)} transações na rede {network}")
+    
+    def _validate(item: Tuple[Optional[Transaction], List[str]]) -> Dict[str, Any]:
+        try:
+            return _validate_parsed(item[0], item[1], network)
+        except Exception as e:
+            return _validation_error(e)
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_VALIDATION_WORKERS, max(1, len(tx_hexes)))) as executor:
+        # A consulta de UTXOs de cada transação começa assim que ela é decodificada,
+        # sobrepondo a latência da rede com a decodificação das seguintes; cada
+        # endereço é pedido uma única vez no lote e o resultado fica no cache
+        parsed = []
+        prefetches = []
+        requested = set()
+        for tx_hex in tx_hexes:
+            item = parse_and_validate_structure(tx_hex)
+            parsed.append(item)
+            addresses = [address for address in _input_addresses(item[0]) if address not in requested]
+            if addresses:
+                requested.update(addresses)
+                prefetches.append(executor.submit(get_utxos_batch, addresses, network))
+        
+        # Falhas na pré-busca não interrompem o lote: validate_funds consulta de novo
+        wait(prefetches)
+        return list(executor.map(_validate, parsed))
+
+def _input_addresses(tx: Optional[Transaction]) -> List[str]:
+    """Endereços dos inputs de uma transação decodificada (lista vazia se inválida)"""
+    if tx is None:
+        return []
+    return [address for address in (getattr(tx_input, 'address', None) for tx_input in tx.inputs) if address]
+
+def _validate_parsed(tx: Optional[Transaction], structure_issues: List[str], network: str) -> Dict[str, Any]:
+    """Monta o resultado da validação a partir da transação já decodificada"""
+    is_valid = tx is not None
+    
+    if not is_valid:
+        logger.warning(f"Transação inválida: {structure_issues}")
         return {
             "is_valid": False,
-            "issues": [f"Erro ao validar transação: {str(e)}"],
+            "issues": structure_issues,
             "details": {
-                "error": str(e),
                 "is_valid_structure": False,
                 "has_sufficient_funds": False
             }
         }
+    
+    has_funds, fund_issues, input_sum, output_sum, is_signed = _validate_inputs_and_funds(tx, network)
+    
+    tx_size = tx.size
+    details = {
+        "version": tx.version,
+        "locktime": getattr(tx, 'locktime', 0),
+        "inputs_count": len(tx.inputs),
+        "outputs_count": len(tx.outputs),
+        "total_input": input_sum,
+        "total_output": output_sum,
+        "fee": input_sum - output_sum if has_funds and input_sum >= output_sum else 0,
+        "is_signed": is_signed,
+        "txid": tx.txid,
+        "estimated_size": tx_size,
+        "estimated_fee_rate": (input_sum - output_sum) / tx_size if has_funds and input_sum > output_sum and tx_size > 0 else 0
+    }
+    
+    is_completely_valid = is_valid and has_funds
+    
+    result = {
+        "is_valid": is_completely_valid,
+        "details": details
+    }
+    
+    all_issues = []
+    if structure_issues:
+        all_issues.extend(structure_issues)
+    if fund_issues:
+        all_issues.extend(fund_issues)
+        
+    if all_issues:
+        result["issues"] = all_issues
+        
+    logger.info(f"Validação concluída: válida={is_valid}, saldo suficiente={has_funds}")
+    return result
+
+def _validation_error(e: Exception) -> Dict[str, Any]:
+    """Resultado retornado quando a validação falha com uma exceção inesperada"""
+    logger.error(f"Erro ao validar transação: {str(e)}", exc_info=True)
+    return {
+        "is_valid": False,
+        "issues": [f"Erro ao validar transação: {str(e)}"],
+        "details": {
+            "error": str(e),
+            "is_valid_structure": False,
+            "has_sufficient_funds": False
+        }
+    }
 
 def validate_structure(tx_hex: str) -> Tuple[bool, List[str]]:
     """
@@ -124,32 +183,61 @@ def validate_structure(tx_hex: str) -> Tuple[bool, List[str]]:
     Returns:
         Tupla (é_válida, lista_de_problemas)
     """
+    tx, issues = parse_and_validate_structure(tx_hex)
+    return tx is not None, issues
+
+def parse_and_validate_structure(tx_hex: str) -> Tuple[Optional[Transaction], List[str]]:
+    """
+    Decodifica a transação e valida sua estrutura básica em uma única passagem.
+    
+    Args:
+        tx_hex: Transação em formato hexadecimal
+        
+    Returns:
+        Tupla (transação decodificada ou None se inválida, lista_de_problemas)
+    """
     issues = []
     
     try:
-        if not all(c in '0123456789abcdefABCDEF' for c in tx_hex):
+        # bytes.fromhex valida em C; a comparação de tamanho rejeita os espaços que ele aceita
+        try:
+            is_hex = len(bytes.fromhex(tx_hex)) * 2 == len(tx_hex)
+        except ValueError:
+            is_hex = False
+        if not is_hex:
             issues.append("Formato hexadecimal inválido")
-            return False, issues
+            return None, issues
         
         if len(tx_hex) < 20:
             issues.append("Transação muito curta")
-            return False, issues
+            return None, issues
         
         tx = Transaction.parse_hex(tx_hex)
         
         if not tx.inputs or len(tx.inputs) == 0:
             issues.append("Transação não tem inputs")
-            return False, issues
+            return None, issues
         
         if not tx.outputs or len(tx.outputs) == 0:
             issues.append("Transação não tem outputs")
-            return False, issues
+            return None, issues
+        
+        # Verificações baratas de consenso feitas aqui para rejeitar a transação
+        # antes de qualquer consulta de UTXOs na rede
+        outpoints = {(tx_input.prev_txid, tx_input.output_n) for tx_input in tx.inputs}
+        if len(outpoints) != len(tx.inputs):
+            issues.append("Transação gasta o mesmo UTXO em mais de um input")
+            return None, issues
         
-        return True, []
+        if sum(output.value for output in tx.outputs) > MAX_MONEY:
+            issues.append("Valor total dos outputs excede o limite de 21 milhões de BTC")
+            return None, issues
+        
+        return tx, []
     
     except Exception as e:
         issues.append(f"Erro ao analisar transação: {str(e)}")
-        return False, issues
+        return None, issues
 
 def validate_funds(tx: Transaction, network: str) -> Tuple[bool, List[str], int, int]:
     """
@@ -162,54 +250,85 @@ def validate_funds(tx: Transaction, network: str) -> Tuple[bool, List[str], int,
     Returns:
         Tupla (tem_fundos_suficientes, problemas, soma_inputs, soma_outputs)
     """
+    has_funds, issues, input_sum, output_sum, _ = _validate_inputs_and_funds(tx, network)
+    return has_funds, issues, input_sum, output_sum
+
+def _validate_inputs_and_funds(tx: Transaction, network: str) -> Tuple[bool, List[str], int, int, bool]:
+    """
+    Percorre os inputs uma única vez, somando os valores e detectando assinaturas.
+    
+    Args:
+        tx: Objeto de transação
+        network: Rede Bitcoin
+        
+    Returns:
+        Tupla (tem_fundos_suficientes, problemas, soma_inputs, soma_outputs, está_assinada)
+    """
     issues = []
     input_sum = 0
     output_sum = 0
+    is_signed = False
     
     try:
-        for output in tx.outputs:
-            output_sum += output.value
+        output_sum = sum(output.value for output in tx.outputs)
         
-        for i, tx_input in enumerate(tx.inputs):
-            if not hasattr(tx_input, 'prev_txid') or not tx_input.prev_txid:
-                issues.append(f"Input {i} não tem TXID anterior")
+        # Endereço de cada input lido uma única vez: usado no lote de UTXOs e no laço abaixo
+        input_addresses = [getattr(tx_input, 'address', None) or None for tx_input in tx.inputs]
+        utxos_by_address = get_utxos_batch([address for address in input_addresses if address], network)
+        # Índice (txid, vout) -> UTXO por endereço, montado uma vez e reaproveitado entre inputs
+        outpoint_indexes: Dict[str, Dict[Tuple[str, int], Dict[str, Any]]] = {}
+        add_issue = issues.append
+        
+        for i, (tx_input, address) in enumerate(zip(tx.inputs, input_addresses)):
+            # Assinatura legacy fica no unlocking_script; segwit, nas witnesses
+            if not is_signed and (getattr(tx_input, 'unlocking_script', None) or getattr(tx_input, 'witnesses', None)):
+                is_signed = True
+            
+            prev_txid = getattr(tx_input, 'prev_txid', None)
+            if not prev_txid:
+                add_issue(f"Input {i} não tem TXID anterior")
                 continue
-                
-            address = tx_input.address if hasattr(tx_input, 'address') and tx_input.address else None
+            # A bitcoinlib guarda o txid anterior em bytes; as APIs retornam hexadecimal
+            if isinstance(prev_txid, bytes):
+                prev_txid = prev_txid.hex()
+            # output_n é mantido em bytes pela bitcoinlib; a versão inteira fica em output_n_int
+            output_n = getattr(tx_input, 'output_n_int', None)
+            if output_n is None:
+                output_n = getattr(tx_input, 'output_n', None)
             
             if address:
-                utxos = get_utxos(address, network)
-                
-                utxo_found = False
-                for utxo in utxos:
-                    if utxo.get('txid') == tx_input.prev_txid and utxo.get('vout') == tx_input.output_n:
-                        input_sum += utxo.get('value', 0)
-                        utxo_found = True
-                        break
+                outpoint_index = outpoint_indexes.get(address)
+                if outpoint_index is None:
+                    outpoint_index = {(utxo.get('txid'), utxo.get('vout')): utxo for utxo in utxos_by_address[address]}
+                    outpoint_indexes[address] = outpoint_index
                 
-                if not utxo_found:
-                    issues.append(f"UTXO não encontrado: {tx_input.prev_txid}:{tx_input.output_n}")
+                utxo = outpoint_index.get((prev_txid, output_n))
+                if utxo is not None:
+                    input_sum += utxo.get('value', 0)
+                else:
+                    add_issue(f"UTXO não encontrado: {prev_txid}:{output_n}")
             else:
-                if hasattr(tx_input, 'value') and tx_input.value:
-                    input_sum += tx_input.value
+                value = getattr(tx_input, 'value', None)
+                if value:
+                    input_sum += value
                 else:
-                    issues.append(f"Input {i} não tem valor definido e endereço não disponível")
+                    add_issue(f"Input {i} não tem valor definido e endereço não disponível")
         
         if input_sum == 0:
             if len(issues) > 0 and output_sum > 0:
                 input_sum = output_sum + 1000  
                 issues.append("Usando valores simulados para inputs (para teste)")
             else:
-                return False, ["Não foi possível verificar os valores dos inputs"], 0, output_sum
+                return False, ["Não foi possível verificar os valores dos inputs"], 0, output_sum, is_signed
         
         has_sufficient_funds = input_sum >= output_sum
         
         if not has_sufficient_funds:
             issues.append(f"Inputs ({input_sum}) menores que outputs ({output_sum})")
         
-        return has_sufficient_funds, issues, input_sum, output_sum
+        return has_sufficient_funds, issues, input_sum, output_sum, is_signed
     
     except Exception as e:
         logger.error(f"Erro ao validar fundos: {str(e)}", exc_info=True)
         issues.append(f"Erro na validação de fundos: {str(e)}")
-        return False, issues, input_sum, output_sum 
\ No newline at end of file
+        return False, issues, input_sum, output_sum, is_signed
@@ -522,6 +522,70 @@ def test_transaction_validation(tx_data):
         pause_for_demo("Tentando novamente em")
         return False
 
+def test_transaction_validation_batch(tx_data):
+    """Testa a validacao em lote, incluindo itens invalidos no meio do lote"""
+    print_section("6.1 VALIDACAO DE TRANSACOES EM LOTE")
+    
+    try:
+        tx_hex = tx_data.get("tx_hex", tx_data.get("signed_tx", tx_data.get("raw_transaction"))) if tx_data else None
+        
+        if not tx_hex:
+            print("❌ Faltando dados da transacao para validacao em lote")
+            return False
+        
+        # Itens invalidos nao derrubam o lote: cada um recebe seu proprio resultado
+        tx_hexes = [tx_hex, "zz", "00", tx_hex]
+        print(f"Validando {len(tx_hexes)} transacoes em lote (2 invalidas)...")
+        
+        response = requests.post(f"{BASE_URL}/validate/batch", json={"tx_hexes": tx_hexes})
+        
+        if response.status_code != 200:
+            print(f"❌ Erro na resposta ({response.status_code}): {response.text}")
+            return False
+        
+        results = response.json()
+        success = True
+        if len(results) == len(tx_hexes):
+            print(f"✅ Um resultado por transacao enviada")
+        else:
+            print(f"❌ Esperados {len(tx_hexes)} resultados, recebidos {len(results)}")
+            return False
+        
+        for index in (1, 2):
+            result = results[index]
+            if result.get("is_valid") is False and result.get("issues"):
+                print(f"✅ Item {index} invalido com problemas reportados: {', '.join(result['issues'])}")
+            else:
+                print(f"❌ Item {index} deveria ser invalido com problemas reportados: {result}")
+                success = False
+        
+        if results[0] == results[3]:
+            print(f"✅ Transacoes repetidas recebem o mesmo resultado (is_valid={results[0].get('is_valid')})")
+        else:
+            print(f"❌ Transacoes repetidas com resultados diferentes")
+            success = False
+        
+        print("\nEnviando lotes invalidos (devem ser rejeitados com 422)...")
+        invalid_requests = {
+            "lista vazia": {"tx_hexes": []},
+            "mais de 100 transacoes": {"tx_hexes": ["00"] * 101}
+        }
+        for description, payload in invalid_requests.items():
+            invalid_response = requests.post(f"{BASE_URL}/validate/batch", json=payload)
+            if invalid_response.status_code == 422:
+                print(f"✅ {description}: rejeitado (422)")
+            else:
+                print(f"❌ {description}: esperado 422, recebido {invalid_response.status_code}")
+                success = False
+        
+        pause_for_demo()
+        return success
+    except Exception as e:
+        print(f"❌ Erro ao validar transacoes em lote: {str(e)}")
+        traceback.print_exc()
+        pause_for_demo("Tentando novamente em")
+        return False
+
 def test_broadcast_transaction(tx_hex):
     """Testa o broadcast de transacoes"""
     print_section("7. BROADCAST DE TRANSACOES")
@@ -611,6 +675,60 @@ def test_transaction_status(txid):
         pause_for_demo("Tentando novamente em")
         return None
 
+def test_transaction_status_batch(txids):
+    """Testa a consulta de status em lote e a validacao dos txids enviados"""
+    print_section("8.1 CONSULTA DE STATUS EM LOTE")
+    
+    try:
+        # Duplicata proposital: a resposta deve manter um item por txid enviado, na mesma ordem
+        batch_txids = list(txids) + [txids[0]]
+        print(f"Consultando status de {len(batch_txids)} transacoes em lote...")
+        
+        response = requests.post(f"{BASE_URL}/tx/status/batch", json={"txids": batch_txids})
+        
+        if response.status_code != 200:
+            print(f"❌ Erro na resposta ({response.status_code}): {response.text}")
+            return False
+        
+        statuses = response.json()
+        success = True
+        if [status.get("txid") for status in statuses] == batch_txids:
+            print(f"✅ Um status por txid, na ordem da requisicao")
+        else:
+            print(f"❌ Status retornados nao correspondem aos txids enviados")
+            success = False
+        
+        for status in statuses:
+            if "status" in status and "explorer_url" in status:
+                print(f"   {status['txid'][:16]}...: {status['status']} ({status.get('confirmations')} confirmacoes)")
+            else:
+                print(f"❌ Item sem status ou explorer_url: {status}")
+                success = False
+        
+        print("\nEnviando txids invalidos (devem ser rejeitados com 422)...")
+        invalid_requests = {
+            "txid com caminho": {"txids": ["x/../../foo"]},
+            "txid curto": {"txids": ["a" * 63]},
+            "txid nao hexadecimal": {"txids": ["g" * 64]},
+            "lista vazia": {"txids": []},
+            "mais de 100 txids": {"txids": ["a" * 64] * 101}
+        }
+        for description, payload in invalid_requests.items():
+            invalid_response = requests.post(f"{BASE_URL}/tx/status/batch", json=payload)
+            if invalid_response.status_code == 422:
+                print(f"✅ {description}: rejeitado (422)")
+            else:
+                print(f"❌ {description}: esperado 422, recebido {invalid_response.status_code}")
+                success = False
+        
+        pause_for_demo()
+        return success
+    except Exception as e:
+        print(f"❌ Erro ao consultar status em lote: {str(e)}")
+        traceback.print_exc()
+        pause_for_demo("Tentando novamente em")
+        return False
+
 def test_cold_wallet_features():
     """Testa funcionalidades específicas de cold wallet"""
     print_section("9. FUNCIONALIDADES DE COLD WALLET")
@@ -729,6 +847,7 @@ def main():
             if signed_tx and "signed_tx" in signed_tx:
                 
                 validation = test_transaction_validation(signed_tx)
+                test_transaction_validation_batch(signed_tx)
                 
                 # Testar broadcast - COMENTADO para nao enviar transacoes reais durante o teste
                 # broadcast = test_broadcast_transaction(signed_tx.get("signed_tx"))
@@ -762,6 +881,7 @@ def main():
             
             # Testar validacao
             validation = test_transaction_validation(tx_data)
+            test_transaction_validation_batch(tx_data)
             
             # Testar broadcast simulado
             broadcast = test_broadcast_transaction(tx_data.get("raw_transaction", "a"*64))
@@ -771,6 +891,12 @@ def main():
             test_txid = "f4184fc596403b9d638783cf57adfe4c75c605f6356fbc91338530e9831e9e16"
             test_transaction_status(test_txid)
     
+    # Testar consulta de status em lote com txids conhecidos
+    test_transaction_status_batch([
+        "f4184fc596403b9d638783cf57adfe4c75c605f6356fbc91338530e9831e9e16",
+        "a" * 64
+    ])
+    
     # Testar funcionalidades de cold wallet
     if test_cold:
         test_cold_wallet_features()
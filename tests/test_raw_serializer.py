@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+Testes do serializador direto de transações (builders/raw_serializer.py)
+
+Este script verifica, sem precisar do servidor rodando, que o caminho rápido do
+BitcoinLibBuilder (inputs sem script) gera exatamente os mesmos bytes e o mesmo
+txid que a bitcoinlib para:
+- Outputs P2PKH, P2WPKH e P2SH
+- Valores extremos de vout e sequence
+
+Uso:
+python -m pytest tests/test_raw_serializer.py
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bitcoinlib.keys import Address, Key
+from bitcoinlib.transactions import Transaction, Input, Output
+from app.models.utxo_models import TransactionRequest
+from app.services.transaction.builders.bitcoin_lib_builder import BitcoinLibBuilder
+
+NETWORK = "testnet"
+MAX_U32 = 0xffffffff
+
+def _addresses():
+    """Gera um endereço de cada tipo a partir de chaves determinísticas"""
+    keys = [Key(bytes([i]) * 32, network=NETWORK) for i in range(1, 4)]
+    return {
+        script_type: Address(key.public_byte, script_type=script_type, encoding=encoding, network=NETWORK).address
+        for key, (script_type, encoding) in zip(keys, (("p2pkh", "base58"), ("p2wpkh", "bech32"), ("p2sh", "base58")))
+    }
+
+ADDRESSES = _addresses()
+
+def _bitcoinlib_reference(inputs, outputs):
+    """Monta a mesma transação pelo caminho da bitcoinlib usado pelo builder"""
+    tx_inputs = []
+    for inp in inputs:
+        tx_input = Input(prev_txid=inp["txid"], output_n=inp["vout"], value=inp.get("value") or 0,
+                         address=inp.get("address"), network=NETWORK)
+        if inp.get("sequence"):
+            tx_input.sequence = inp["sequence"]
+        tx_inputs.append(tx_input)
+    tx_outputs = [Output(value=out["value"], address=out["address"], network=NETWORK) for out in outputs]
+    tx = Transaction(inputs=tx_inputs, outputs=tx_outputs, network=NETWORK)
+    return tx.raw_hex(), tx.txid
+
+def _assert_matches(inputs, outputs):
+    request = TransactionRequest(inputs=inputs, outputs=outputs)
+    response = BitcoinLibBuilder().build(request, NETWORK)
+    raw_hex, txid = _bitcoinlib_reference(inputs, outputs)
+    assert response.raw_transaction == raw_hex
+    assert response.txid == txid
+
+def test_output_types():
+    """Cada tipo de output isolado e todos juntos"""
+    assert ADDRESSES["p2pkh"][0] in "mn" and ADDRESSES["p2sh"][0] == "2" and ADDRESSES["p2wpkh"].startswith("tb1q")
+    inputs = [{"txid": "7a1ae0dc85ea676e63485de4394a5d78fbfc8c02e012c0ebb19ce91f573d283e",
+               "vout": 0, "value": 100000}]
+    for address in ADDRESSES.values():
+        _assert_matches(inputs, [{"address": address, "value": 50000}])
+    _assert_matches(inputs, [{"address": address, "value": 10000 + i}
+                             for i, address in enumerate(ADDRESSES.values())])
+
+def test_edge_vout_and_sequence():
+    """Limites de vout (u32) e valores de sequence usados em RBF e locktime"""
+    outputs = [{"address": ADDRESSES["p2wpkh"], "value": 1000}]
+    for vout in (0, 1, 0xfc, 0xfd, 0xffff, 0x10000, MAX_U32):
+        for sequence in (None, 1, 0xfffffffd, 0xfffffffe, MAX_U32):
+            inputs = [{"txid": "ab" * 32, "vout": vout, "value": 2000, "sequence": sequence}]
+            _assert_matches(inputs, outputs)
+
+def test_random_transactions():
+    """Transações aleatórias com 1 a 4 inputs e outputs"""
+    rng = random.Random(1)
+    for _ in range(100):
+        inputs = [{
+            "txid": rng.randbytes(32).hex(),
+            "vout": rng.randrange(MAX_U32 + 1),
+            "value": rng.randrange(10 ** 8, 10 ** 9),
+            "sequence": rng.choice((None, rng.randrange(1, MAX_U32 + 1)))
+        } for _ in range(rng.randint(1, 4))]
+        outputs = [{
+            "address": rng.choice(list(ADDRESSES.values())),
+            "value": rng.randrange(546, 10 ** 7)
+        } for _ in range(rng.randint(1, 4))]
+        _assert_matches(inputs, outputs)
+
+if __name__ == "__main__":
+    test_output_types()
+    test_edge_vout_and_sequence()
+    test_random_transactions()
+    print("✅ Serialização direta idêntica à da bitcoinlib")